@@ -0,0 +1,219 @@
+"""
+Job Deduplication
+Collapses the same posting seen on several boards or under several keywords
+"""
+
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import logging
+import re
+import zlib
+
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track how a link was reached
+TRACKING_PARAMS = {
+    'trk', 'trackingid', 'refid', 'ref', 'position', 'pagenum', 'from', 'src',
+    'gclid', 'fbclid', 'mc_cid', 'mc_eid', 'vjs', 'tk', 'advn', 'adid', 'sjdu', 'ebp', 'lipi',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# Legal suffixes dropped when comparing company names
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'company', 'gmbh', 'plc'}
+
+# Location words boards append to titles, e.g. "Ops Manager (Remote - US)"
+TITLE_NOISE = {'remote', 'us', 'usa', 'anywhere', 'wfh'}
+
+# Companies too generic to decide that two titles are the same posting
+UNKNOWN_COMPANIES = {'', 'unknown', '4hww partner'}
+
+# MinHash / LSH parameters: 4 bands of 4 slots catch pairs above roughly 0.7
+# title similarity as candidates, which are then checked exactly
+NUM_SLOTS = 16
+BANDS = 4
+ROWS = NUM_SLOTS // BANDS
+SIMILARITY_THRESHOLD = 0.8
+
+_SLOT_BITS = 4  # log2(NUM_SLOTS)
+_VALUE_MASK = (1 << (32 - _SLOT_BITS)) - 1
+_LINKEDIN_JOB_ID = re.compile(r'/jobs/view/(?:[^/]*-)?(\d+)')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a job URL so the same posting always maps to the same string
+
+    Strips tracking parameters and fragments, sorts the remaining query
+    string, and reduces Indeed and LinkedIn links to their job IDs.
+
+    Args:
+        url: Job URL as scraped
+
+    Returns:
+        Canonical URL
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host.endswith('indeed.com'):
+        job_id = dict(query).get('jk')
+        if job_id:
+            return f'https://www.indeed.com/viewjob?jk={job_id}'
+
+    if host.endswith('linkedin.com'):
+        match = _LINKEDIN_JOB_ID.search(parts.path)
+        job_id = match.group(1) if match else dict(query).get('currentJobId')
+        if job_id:
+            return f'https://www.linkedin.com/jobs/view/{job_id}'
+
+    query = sorted(
+        (k, v) for k, v in query
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def _normalize_company(company: str) -> str:
+    words = re.sub(r'[^a-z0-9]+', ' ', (company or '').lower()).split()
+    return ' '.join(w for w in words if w not in COMPANY_SUFFIXES)
+
+
+def _shingles(title: str) -> frozenset:
+    words = re.sub(r'[^a-z0-9]+', ' ', (title or '').lower()).split()
+    text = ' '.join(w for w in words if w not in TITLE_NOISE)
+    if len(text) < 3:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    union = a | b
+    return len(a & b) / len(union) if union else 1.0
+
+
+def _minhash(shingles: frozenset) -> List[int]:
+    # One-permutation MinHash: a single hash per shingle, split into a slot
+    # (top bits) and a value (the rest); each slot keeps its minimum
+    signature = [-1] * NUM_SLOTS
+    for shingle in shingles:
+        h = (zlib.crc32(shingle.encode('utf-8')) * 0x9E3779B1) & 0xFFFFFFFF
+        slot, value = h >> (32 - _SLOT_BITS), h & _VALUE_MASK
+        if signature[slot] < 0 or value < signature[slot]:
+            signature[slot] = value
+    return signature
+
+
+class Deduplicator:
+    """
+    Incremental duplicate filter
+
+    Exact duplicates are caught by canonical URL. Near-duplicates (same
+    company, nearly the same title) are found through a MinHash LSH index, so
+    each new job is only compared against the few postings that share a band
+    with it instead of every job seen so far.
+
+    The first posting to arrive survives. It may already have been
+    classified, indexed and scored further down the pipeline, so a later
+    duplicate only adds its source and fills in a missing description;
+    for jobs tagged with `order` by iter_scrapers, `sources` is kept in
+    source order however the scraper threads interleaved.
+    """
+
+    def __init__(self):
+        self.by_url: Dict[str, Dict] = {}
+        self.buckets: Dict[Tuple, List[Tuple[frozenset, Dict]]] = {}
+        self.duplicates = 0
+        # Source name -> its index in iter_scrapers' sources
+        self._source_index: Dict[str, int] = {}
+
+    def add(self, job: Dict) -> Optional[Dict]:
+        """
+        Offer a job to the index
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            The job (with `canonical_url` and `sources` set) if it is new, or
+            None if it was merged into an earlier posting
+        """
+        if job.get('order'):
+            self._source_index.setdefault(job.get('source', ''), job['order'][0])
+
+        canonical = canonicalize_url(job.get('url', ''))
+        company = _normalize_company(job.get('company', ''))
+        shingles = _shingles(job.get('title', ''))
+        band_keys = []
+
+        # Scrapers fall back to the search page URL when a card has no link,
+        # so a shared URL only counts if the titles agree too
+        original = self.by_url.get(canonical) if canonical else None
+        if original is not None:
+            if _similarity(shingles, _shingles(original.get('title', ''))) < SIMILARITY_THRESHOLD:
+                original = None
+
+        if original is None and company not in UNKNOWN_COMPANIES and shingles:
+            signature = _minhash(shingles)
+            band_keys = [
+                (company, band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+                for band in range(BANDS)
+            ]
+            original = self._near_duplicate(band_keys, shingles)
+
+        if original is not None:
+            self._merge(original, job)
+            self.duplicates += 1
+            if canonical:
+                self.by_url.setdefault(canonical, original)
+            return None
+
+        job['canonical_url'] = canonical
+        job['sources'] = [job.get('source', '')]
+        if canonical:
+            self.by_url[canonical] = job
+        for key in band_keys:
+            self.buckets.setdefault(key, []).append((shingles, job))
+        return job
+
+    def _near_duplicate(self, band_keys: List[Tuple], shingles: frozenset) -> Optional[Dict]:
+        seen = set()
+        for key in band_keys:
+            for other_shingles, other in self.buckets.get(key, ()):
+                if id(other) in seen:
+                    continue
+                seen.add(id(other))
+                if _similarity(shingles, other_shingles) >= SIMILARITY_THRESHOLD:
+                    return other
+        return None
+
+    def _merge(self, original: Dict, duplicate: Dict):
+        source = duplicate.get('source', '')
+        if source not in original['sources']:
+            original['sources'].append(source)
+            original['sources'].sort(key=lambda name: self._source_index.get(name, float('inf')))
+
+        if not original.get('description') and duplicate.get('description'):
+            original['description'] = duplicate['description']
+
+
+def dedupe_jobs(jobs: List[Dict]) -> List[Dict]:
+    """
+    Remove duplicate postings, keeping the first occurrence of each
+
+    Args:
+        jobs: List of job dictionaries, possibly from several sources
+
+    Returns:
+        Unique jobs in their original order, each listing every source it
+        was seen on under `sources`
+    """
+    dedup = Deduplicator()
+    unique = [job for job in jobs if dedup.add(job) is not None]
+    logger.info(f"Removed {dedup.duplicates} duplicate jobs, {len(unique)} unique")
+    return unique
@@ -0,0 +1,117 @@
+"""
+Phrase Matcher
+Finds every configured phrase in a text in one call
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable
+
+
+# Above this many phrases one combined regex scan beats a substring search
+# per phrase; below it CPython's memchr-backed `in` is faster
+REGEX_MIN_PHRASES = 64
+
+# Short fields such as location and company repeat across postings, so
+# their results are memoized
+MEMO_MAX_LENGTH = 120
+MEMO_MAX_ENTRIES = 20000
+
+
+class PhraseMatcher:
+    """
+    Multi-phrase substring matcher
+
+    Built once from the configured phrases, then returns every phrase found in
+    a text at the same time. Large phrase sets are folded into a single
+    trie-shaped regex so the text is scanned once. Results are identical to
+    testing `phrase in text` for each phrase separately.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        """
+        Args:
+            phrases: Phrases to look for; matching is case-insensitive
+        """
+        self.phrases = frozenset(p.lower() for p in phrases if p)
+        self._ordered = tuple(sorted(self.phrases))
+        self._memo: Dict[str, FrozenSet[str]] = {}
+        self._pattern = None
+
+        if len(self.phrases) >= REGEX_MIN_PHRASES:
+            trie: Dict = {}
+            for phrase in self.phrases:
+                node = trie
+                for char in phrase:
+                    node = node.setdefault(char, {})
+                node[''] = True
+
+            # The greedy trie finds the longest phrase starting at a position
+            self._pattern = re.compile(_trie_pattern(trie))
+
+            # Phrases that are substrings of another phrase are implied by it,
+            # which recovers the shorter matches the longest-match scan skips
+            self._implied = {
+                phrase: frozenset(other for other in self.phrases if other in phrase)
+                for phrase in self.phrases
+            }
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Return every phrase that occurs in the text
+
+        Args:
+            text: Text to scan, already lowercased
+
+        Returns:
+            Set of matched (lowercased) phrases
+        """
+        if not text:
+            return frozenset()
+
+        short = len(text) <= MEMO_MAX_LENGTH
+        if short:
+            found = self._memo.get(text)
+            if found is not None:
+                return found
+
+        if self._pattern is None:
+            found = frozenset(phrase for phrase in self._ordered if phrase in text)
+        else:
+            found = self._scan(text)
+
+        if short:
+            if len(self._memo) >= MEMO_MAX_ENTRIES:
+                self._memo.clear()
+            self._memo[text] = found
+        return found
+
+    def _scan(self, text: str) -> FrozenSet[str]:
+        """Single regex pass, restarting after each match start to catch overlaps"""
+        longest = set()
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            longest.add(match.group())
+            match = search(text, match.start() + 1)
+
+        found = set()
+        for phrase in longest:
+            found |= self._implied[phrase]
+        return frozenset(found)
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Render a trie node as a regex that prefers the longest branch"""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items()) if char != ''
+    ]
+    if not branches:
+        return ''
+
+    terminal = '' in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+
+    group = f"(?:{'|'.join(branches)})"
+    return f'{group}?' if terminal else group
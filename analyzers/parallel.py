@@ -0,0 +1,76 @@
+"""
+Parallel Scoring
+Spreads large scoring batches across worker processes
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from analyzers.scorer import JobScorer, score_all
+
+
+# Jobs per task; large enough for each worker to take the NumPy path
+CHUNK_SIZE = 2000
+
+# Scorer of the current worker process, built once by _init_worker()
+_scorer: Optional[JobScorer] = None
+
+
+def _init_worker(config_path: str):
+    global _scorer
+    _scorer = JobScorer(config_path)
+
+
+def _score_chunk(jobs: List[Dict]) -> List[Dict]:
+    results = score_all(_scorer, jobs)
+    # The parent already has the jobs; don't send them back
+    for result in results:
+        del result['job']
+    return results
+
+
+class ScoringPool:
+    """
+    Worker processes that each hold a JobScorer for one configuration
+
+    The scorer (config, phrase matcher and its memo) is built once per
+    worker by the pool initializer, so tasks only carry the jobs. Pass the
+    pool to score_jobs_batch(); it is used for batches of PARALLEL_MIN_JOBS
+    or more.
+    """
+
+    def __init__(self, config_path: str = 'config.json', processes: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        """
+        Args:
+            config_path: Scoring configuration every worker loads
+            processes: Worker processes; defaults to the CPU count
+            chunk_size: Jobs sent to a worker per task
+        """
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                             initargs=(config_path,))
+
+    def score_all(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Score every job, passed or not, in input order
+
+        Chunks are contiguous and their results are reassembled in
+        submission order, so the output matches analyzers.scorer.score_all()
+        exactly, whatever order the workers finish in.
+        """
+        chunks = [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+        results = []
+        for chunk, scored in zip(chunks, self._executor.map(_score_chunk, chunks)):
+            for job, result in zip(chunk, scored):
+                results.append({'job': job, **result})
+        return results
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self) -> 'ScoringPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,95 @@
+"""
+Scoring Profile
+config.json compiled once per process into everything JobScorer needs
+"""
+
+from typing import Dict, FrozenSet, Tuple
+import hashlib
+import json
+import threading
+
+from analyzers.matcher import PhraseMatcher
+
+
+# Profiles built by this process, by hash of the config file
+_profiles: Dict[str, 'ScoringProfile'] = {}
+_lock = threading.Lock()
+
+
+class ScoringProfile:
+    """
+    The scoring configuration, compiled
+
+    Phrase lists are lowercased, target roles split into word sets, weights
+    lined up with the sub-scores and the phrase matcher built, so a scorer
+    made from a profile does no setup and no per-job re-tokenizing.
+    """
+
+    def __init__(self, config: Dict):
+        # Local import: scorer.py imports this module
+        from analyzers.scorer import (
+            NOT_REMOTE_PHRASES, ONSITE_PHRASES, REMOTE_PHRASES, STARTUP_INDICATORS, SUB_SCORES,
+            _fingerprint
+        )
+
+        self.criteria = config['job_search_criteria']
+        self.weights = config['scoring_weights']
+
+        self.industries = [i.lower() for i in self.criteria['target_industries']]
+        self.stages = [s.lower() for s in self.criteria['company_stage']]
+        self.skills = [s.lower() for s in self.criteria['required_skills']]
+        self.avoid_requirements = self.criteria['avoid']['requirements']
+        self.avoid = [req.lower() for req in self.avoid_requirements]
+
+        # Word set of each target role with its size, in config order
+        self.roles: Tuple[Tuple[FrozenSet[str], int], ...] = tuple(
+            (words, len(words))
+            for words in (frozenset(role.lower().split()) for role in self.criteria['target_roles'])
+        )
+
+        # Weight of each sub-score, in SUB_SCORES order
+        self.weighted = tuple(
+            (key, self.weights[key.replace('_score', '_match')]) for key in SUB_SCORES
+        )
+
+        # One matcher for every phrase any sub-score looks for
+        self.matcher = PhraseMatcher(
+            ONSITE_PHRASES | REMOTE_PHRASES | NOT_REMOTE_PHRASES | STARTUP_INDICATORS |
+            set(self.industries + self.stages + self.skills + self.avoid)
+        )
+
+        # Which slice of the configuration each component depends on, so a
+        # config edit only invalidates the cached components it affects
+        self.fingerprints = {
+            'remote_score': _fingerprint(ONSITE_PHRASES, REMOTE_PHRASES),
+            'industry_score': _fingerprint(self.criteria['target_industries']),
+            'role_score': _fingerprint(self.criteria['target_roles']),
+            'company_stage_score': _fingerprint(self.criteria['company_stage'], STARTUP_INDICATORS),
+            'skills_score': _fingerprint(self.criteria['required_skills']),
+            'deal_breakers': _fingerprint(self.avoid_requirements, NOT_REMOTE_PHRASES)
+        }
+
+
+def load_profile(config_path: str = 'config.json') -> ScoringProfile:
+    """
+    Compiled profile of a config file, built at most once per config
+
+    Profiles are keyed by a hash of the file's contents, so an edited config
+    is compiled afresh while repeated scorers, batches and pool workers
+    (which build theirs once, in the initializer) reuse the compiled one.
+
+    Args:
+        config_path: Path to config file
+
+    Returns:
+        The shared profile; treat it as read-only
+    """
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    key = hashlib.sha256(content).hexdigest()
+
+    with _lock:
+        profile = _profiles.get(key)
+        if profile is None:
+            profile = _profiles[key] = ScoringProfile(json.loads(content))
+    return profile
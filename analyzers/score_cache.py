@@ -0,0 +1,143 @@
+"""
+Score Cache
+Persists job sub-scores between runs so unchanged postings aren't re-scored
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import time
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 1
+
+
+def job_key(job: Dict) -> str:
+    """Hash of the job fields that scoring reads"""
+    payload = json.dumps([job.get(field) or '' for field in ('title', 'company', 'location', 'description')])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ScoreCache:
+    """
+    Sub-scores keyed by job content hash
+
+    Each stored component carries the fingerprint of the configuration slice
+    it was computed from (see JobScorer.fingerprints). Editing, say, the
+    target industries only invalidates industry scores; weights are applied
+    afresh on every run, so changing them invalidates nothing.
+    """
+
+    def __init__(self, path: str = 'data/score_cache.json', max_age_days: float = 30):
+        """
+        Args:
+            path: JSON file the cache is kept in
+            max_age_days: Entries not used for this long are evicted on save
+        """
+        self.path = Path(path)
+        self.max_age = max_age_days * 86400
+        self.entries: Dict[str, Dict] = {}
+        self.stats = {'hits': 0, 'partial': 0, 'misses': 0}
+
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get('format') == CACHE_FORMAT:
+                self.entries = data['entries']
+        except (OSError, ValueError):
+            pass
+
+    def lookup(self, key: str, fingerprints: Dict[str, str]) -> Optional[Dict]:
+        """
+        Return the still-valid cached components for a job
+
+        Args:
+            key: job_key() of the job
+            fingerprints: Current JobScorer.fingerprints
+
+        Returns:
+            Dictionary of component -> value, or None if nothing is cached
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        entry['used'] = time.time()
+        return {
+            name: value
+            for name, (fingerprint, value) in entry['components'].items()
+            if fingerprints.get(name) == fingerprint
+        }
+
+    def store(self, key: str, values: Dict, fingerprints: Dict[str, str]):
+        """Record freshly computed component values for a job"""
+        entry = self.entries.setdefault(key, {'components': {}})
+        entry['used'] = time.time()
+        for name, value in values.items():
+            entry['components'][name] = [fingerprints[name], value]
+
+    def save(self):
+        """Evict stale entries and write the cache to disk"""
+        cutoff = time.time() - self.max_age
+        self.entries = {k: v for k, v in self.entries.items() if v['used'] >= cutoff}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'format': CACHE_FORMAT, 'entries': self.entries}))
+        os.replace(tmp, self.path)
+
+        logger.info(
+            f"Score cache: {self.stats['hits']} hits, {self.stats['partial']} partial, "
+            f"{self.stats['misses']} misses; {len(self.entries)} entries kept"
+        )
+
+    def score(self, scorer, jobs: List[Dict],
+              score_misses: Callable[[List[Dict]], List[Dict]]) -> List[Dict]:
+        """
+        Score jobs, reusing cached components wherever they are still valid
+
+        Args:
+            scorer: JobScorer for the current configuration
+            jobs: List of job dictionaries
+            score_misses: Scores never-seen jobs, returning every result in order
+
+        Returns:
+            Every scored job, in input order
+        """
+        from analyzers.scorer import COMPONENTS, SUB_SCORES
+
+        fingerprints = scorer.fingerprints
+        results = [None] * len(jobs)
+        keys = [job_key(job) for job in jobs]
+        misses = []
+
+        for i, (job, key) in enumerate(zip(jobs, keys)):
+            cached = self.lookup(key, fingerprints)
+            if cached is None:
+                misses.append(i)
+                continue
+
+            stale = [name for name in COMPONENTS if name not in cached]
+            if stale:
+                fresh = scorer.score_components(job, stale)
+                self.store(key, fresh, fingerprints)
+                cached.update(fresh)
+                self.stats['partial'] += 1
+            else:
+                self.stats['hits'] += 1
+
+            results[i] = scorer.assemble(job, cached, cached['deal_breakers'])
+
+        if misses:
+            self.stats['misses'] += len(misses)
+            for i, result in zip(misses, score_misses([jobs[i] for i in misses])):
+                values = {name: result['scores'][name] for name in SUB_SCORES}
+                values['deal_breakers'] = result['deal_breakers']
+                self.store(keys[i], values, fingerprints)
+                results[i] = result
+
+        return results
@@ -3,18 +3,80 @@ Job Scoring Module
 Analyzes job postings and scores them based on fit criteria
 """
 
+import hashlib
 import json
+import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from analyzers.profile import ScoringProfile, load_profile
+from analyzers.score_cache import ScoreCache
+
+
+# Phrases that decide the remote score and the location deal-breaker
+ONSITE_PHRASES = frozenset(['on-site', 'onsite', 'in-office', 'office-based', 'hybrid'])
+REMOTE_PHRASES = frozenset(['remote', 'work from home', 'wfh', 'distributed', 'anywhere'])
+NOT_REMOTE_PHRASES = frozenset(['hybrid', 'in-office', 'on-site', 'relocation required'])
+STARTUP_INDICATORS = frozenset(['startup', 'early stage', 'growing team', 'series a', 'series b', 'yc', 'y combinator'])
+
+# Job fields the matcher scans
+SCANNED_FIELDS = ('location', 'company', 'description')
+
+# Sub-scores in the order they are weighted, plus the deal-breaker check
+SUB_SCORES = ('remote_score', 'industry_score', 'role_score', 'company_stage_score', 'skills_score')
+COMPONENTS = SUB_SCORES + ('deal_breakers',)
+
+# Bump when scoring logic changes so cached component values are discarded
+SCORING_VERSION = 1
+
+# Batch size from which score_jobs_batch switches to the NumPy path
+VECTORIZE_MIN_JOBS = 1000
+
+# Batch size from which score_jobs_batch hands work to a ScoringPool, if given
+PARALLEL_MIN_JOBS = 4000
+
+logger = logging.getLogger(__name__)
 
 
 class JobScorer:
-    def __init__(self, config_path: str = "config.json"):
-        """Initialize scorer with configuration"""
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        self.criteria = config['job_search_criteria']
-        self.weights = config['scoring_weights']
+    def __init__(self, config_path: str = "config.json", profile: Optional[ScoringProfile] = None):
+        """
+        Initialize scorer with configuration
+
+        Args:
+            config_path: Path to config file
+            profile: Compiled profile to use instead of loading config_path
+        """
+        self.profile = profile or load_profile(config_path)
+        self.criteria = self.profile.criteria
+        self.weights = self.profile.weights
+
+        self.industries = self.profile.industries
+        self.stages = self.profile.stages
+        self.skills = self.profile.skills
+        self.avoid_requirements = self.profile.avoid_requirements
+
+        # Shared by every scorer of this config, memo included
+        self.matcher = self.profile.matcher
+        self.fingerprints = self.profile.fingerprints
+
+    def scan(self, job: Dict) -> Dict[str, FrozenSet[str]]:
+        """
+        Find every configured phrase in a job in one pass per field
+
+        Fields are scanned separately, so a phrase never straddles the
+        boundary between, say, the company name and the description.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            Dictionary of field name -> set of matched phrases
+        """
+        return {
+            field: self.matcher.find((job.get(field) or '').lower())
+            for field in SCANNED_FIELDS
+        }
     
     def score_job(self, job: Dict) -> Dict:
         """
@@ -34,22 +96,55 @@ class JobScorer:
         Returns:
             Dictionary with scores and reasoning
         """
-        scores = {
-            'remote_score': self._score_remote(job),
-            'industry_score': self._score_industry(job),
-            'role_score': self._score_role(job),
-            'company_stage_score': self._score_company_stage(job),
-            'skills_score': self._score_skills(job)
-        }
+        components = self.score_components(job)
+        deal_breakers = components.pop('deal_breakers')
+        return self.assemble(job, components, deal_breakers)
+    
+    def score_components(self, job: Dict, components: Iterable[str] = COMPONENTS) -> Dict:
+        """
+        Compute some or all of a job's sub-scores and deal-breakers
         
-        # Calculate weighted total
-        total_score = sum(
-            scores[key.replace('_score', '') + '_score'] * self.weights[key.replace('_score', '') + '_match']
-            for key in scores.keys()
-        )
+        Args:
+            job: Job dictionary
+            components: Names from COMPONENTS to compute
+        
+        Returns:
+            Dictionary of component name -> value
+        """
+        wanted = set(components)
+        hits = self.scan(job) if wanted - {'role_score'} else None
+        
+        values = {}
+        if 'remote_score' in wanted:
+            values['remote_score'] = self._score_remote(job, hits)
+        if 'industry_score' in wanted:
+            values['industry_score'] = self._score_industry(job, hits)
+        if 'role_score' in wanted:
+            values['role_score'] = self._score_role(job)
+        if 'company_stage_score' in wanted:
+            values['company_stage_score'] = self._score_company_stage(job, hits)
+        if 'skills_score' in wanted:
+            values['skills_score'] = self._score_skills(job, hits)
+        if 'deal_breakers' in wanted:
+            values['deal_breakers'] = self._check_deal_breakers(job, hits)
+        return values
+    
+    def assemble(self, job: Dict, scores: Dict, deal_breakers: List[str]) -> Dict:
+        """
+        Combine sub-scores into a weighted, pass/fail scored job
         
-        # Check for deal-breakers
-        deal_breakers = self._check_deal_breakers(job)
+        Args:
+            job: Job dictionary
+            scores: The five *_score values
+            deal_breakers: Deal-breaker reasons, if any
+        
+        Returns:
+            Dictionary with scores and reasoning
+        """
+        scores = {key: scores[key] for key in SUB_SCORES}
+        
+        # Calculate weighted total
+        total_score = sum(scores[key] * weight for key, weight in self.profile.weighted)
         
         return {
             'job': job,
@@ -59,33 +154,28 @@ class JobScorer:
             'passed': total_score >= 0.5 and not deal_breakers
         }
     
-    def _score_remote(self, job: Dict) -> float:
+    def _score_remote(self, job: Dict, hits: Dict = None) -> float:
         """Score based on remote work requirement"""
-        location = job.get('location', '').lower()
-        description = job.get('description', '').lower()
+        hits = hits or self.scan(job)
+        found = hits['location'] | hits['description']
         
         # Deal-breaker: must be remote
-        if any(phrase in location or phrase in description for phrase in [
-            'on-site', 'onsite', 'in-office', 'office-based', 'hybrid'
-        ]):
+        if not found.isdisjoint(ONSITE_PHRASES):
             return 0.0
         
-        if any(phrase in location or phrase in description for phrase in [
-            'remote', 'work from home', 'wfh', 'distributed', 'anywhere'
-        ]):
+        if not found.isdisjoint(REMOTE_PHRASES):
             return 1.0
         
         return 0.3  # Unknown, but possible
     
-    def _score_industry(self, job: Dict) -> float:
+    def _score_industry(self, job: Dict, hits: Dict = None) -> float:
         """Score based on industry match"""
-        company = job.get('company', '').lower()
-        description = job.get('description', '').lower()
-        combined = f"{company} {description}"
+        hits = hits or self.scan(job)
+        combined = hits['company'] | hits['description']
         
         matches = 0
-        for industry in self.criteria['target_industries']:
-            if industry.lower() in combined:
+        for industry in self.industries:
+            if industry in combined:
                 matches += 1
         
         # Normalize to 0-1 scale
@@ -93,81 +183,141 @@ class JobScorer:
     
     def _score_role(self, job: Dict) -> float:
         """Score based on role/title match"""
-        title = job.get('title', '').lower()
-        
-        for target_role in self.criteria['target_roles']:
-            # Check if key words from target role are in job title
-            role_words = set(target_role.lower().split())
-            title_words = set(title.split())
-            
-            # Calculate word overlap
-            overlap = len(role_words & title_words) / len(role_words)
+        title_words = set(job.get('title', '').lower().split())
+        
+        for role_words, role_size in self.profile.roles:
+            # Check if key words from target role are in job title,
+            # calculating the word overlap
+            overlap = len(role_words & title_words) / role_size
             if overlap >= 0.5:  # At least 50% word match
                 return overlap
         
         return 0.0
     
-    def _score_company_stage(self, job: Dict) -> float:
+    def _score_company_stage(self, job: Dict, hits: Dict = None) -> float:
         """Score based on company stage preference"""
-        company = job.get('company', '').lower()
-        description = job.get('description', '').lower()
-        combined = f"{company} {description}"
+        hits = hits or self.scan(job)
+        combined = hits['company'] | hits['description']
         
-        for stage in self.criteria['company_stage']:
-            if stage.lower() in combined:
+        for stage in self.stages:
+            if stage in combined:
                 return 1.0
         
         # Check for startup indicators
-        startup_indicators = ['startup', 'early stage', 'growing team', 'series a', 'series b', 'yc', 'y combinator']
-        if any(indicator in combined for indicator in startup_indicators):
+        if not combined.isdisjoint(STARTUP_INDICATORS):
             return 0.8
         
         return 0.3  # Unknown
     
-    def _score_skills(self, job: Dict) -> float:
+    def _score_skills(self, job: Dict, hits: Dict = None) -> float:
         """Score based on required skills match"""
-        description = job.get('description', '').lower()
+        hits = hits or self.scan(job)
         
         matches = 0
-        for skill in self.criteria['required_skills']:
-            if skill.lower() in description:
+        for skill in self.skills:
+            if skill in hits['description']:
                 matches += 1
         
         # Normalize to 0-1 scale
         return min(matches / 5, 1.0)  # Cap at 5 skill matches
     
-    def _check_deal_breakers(self, job: Dict) -> List[str]:
+    def _check_deal_breakers(self, job: Dict, hits: Dict = None) -> List[str]:
         """Check for deal-breaker requirements"""
         deal_breakers = []
-        location = job.get('location', '').lower()
-        description = job.get('description', '').lower()
-        combined = f"{location} {description}"
+        hits = hits or self.scan(job)
+        combined = hits['location'] | hits['description']
         
         # Check location deal-breakers
-        if any(phrase in combined for phrase in ['hybrid', 'in-office', 'on-site', 'relocation required']):
+        if not combined.isdisjoint(NOT_REMOTE_PHRASES):
             deal_breakers.append("Not fully remote")
         
         # Check avoided requirements
-        for avoid_req in self.criteria['avoid']['requirements']:
-            if avoid_req.lower() in combined:
+        for avoid_req, phrase in zip(self.avoid_requirements, self.profile.avoid):
+            if phrase in combined:
                 deal_breakers.append(f"Contains: {avoid_req}")
         
         return deal_breakers
 
 
-def score_jobs_batch(jobs: List[Dict], config_path: str = "config.json") -> List[Dict]:
+def _fingerprint(*parts) -> str:
+    """Short stable hash of configuration values"""
+    normalized = [sorted(p) if isinstance(p, frozenset) else p for p in parts]
+    payload = json.dumps([SCORING_VERSION, normalized], sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def score_all(scorer: JobScorer, jobs: List[Dict], vectorized: Optional[bool] = None) -> List[Dict]:
+    """
+    Score every job, passed or not, in input order
+
+    Args:
+        scorer: JobScorer to use
+        jobs: List of job dictionaries
+        vectorized: Use the NumPy path; by default it is used for batches of
+            VECTORIZE_MIN_JOBS or more when NumPy is installed
+    """
+    score_vectorized = _vectorized_path(jobs, vectorized)
+    if score_vectorized:
+        return score_vectorized(scorer, jobs, passed_only=False)
+    return [scorer.score_job(job) for job in jobs]
+
+
+def _vectorized_path(jobs: List[Dict], vectorized: Optional[bool]):
+    """score_jobs_vectorized when it should and can be used, else None"""
+    if vectorized is None:
+        vectorized = len(jobs) >= VECTORIZE_MIN_JOBS
+    if not vectorized:
+        return None
+    try:
+        from analyzers.vectorized import score_jobs_vectorized
+        return score_jobs_vectorized
+    except ImportError:
+        logger.warning("NumPy is not installed; scoring jobs one at a time")
+        return None
+
+
+def score_jobs_batch(jobs: List[Dict], config_path: str = "config.json",
+                     vectorized: Optional[bool] = None,
+                     cache: Optional[ScoreCache] = None,
+                     scorer: Optional[JobScorer] = None,
+                     pool=None) -> List[Dict]:
     """
     Score a batch of jobs and return sorted by score
     
     Args:
         jobs: List of job dictionaries
         config_path: Path to config file
+        vectorized: Use the NumPy columnar path; by default it is used for
+            batches of VECTORIZE_MIN_JOBS or more when NumPy is installed
+        cache: Optional ScoreCache to reuse sub-scores of unchanged jobs;
+            the caller saves it
+        scorer: Reuse an existing JobScorer instead of loading config_path,
+            e.g. when scoring a stream chunk by chunk
+        pool: Optional analyzers.parallel.ScoringPool, loaded with the same
+            config, that scores batches of PARALLEL_MIN_JOBS or more across
+            processes; the output is the same as without it
     
     Returns:
         List of scored jobs, sorted by total_score descending
     """
-    scorer = JobScorer(config_path)
-    scored_jobs = [scorer.score_job(job) for job in jobs]
+    if scorer is None:
+        scorer = JobScorer(config_path)
+
+    def score_batch(batch: List[Dict]) -> List[Dict]:
+        if pool is not None and len(batch) >= PARALLEL_MIN_JOBS:
+            return pool.score_all(batch)
+        return score_all(scorer, batch, vectorized)
+
+    if cache is not None:
+        scored_jobs = cache.score(scorer, jobs, score_batch)
+    elif pool is not None and len(jobs) >= PARALLEL_MIN_JOBS:
+        scored_jobs = pool.score_all(jobs)
+    else:
+        score_vectorized = _vectorized_path(jobs, vectorized)
+        if score_vectorized:
+            # Only passing jobs get result dictionaries on this path
+            return score_vectorized(scorer, jobs)
+        scored_jobs = [scorer.score_job(job) for job in jobs]
     
     # Filter passed jobs and sort by score
     passed_jobs = [j for j in scored_jobs if j['passed']]
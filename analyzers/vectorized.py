@@ -0,0 +1,110 @@
+"""
+Vectorized Batch Scoring
+Columnar NumPy scoring path for large job batches
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+def score_jobs_vectorized(scorer, jobs: List[Dict], passed_only: bool = True) -> List[Dict]:
+    """
+    Score a batch of jobs as array operations
+
+    Each job is scanned once into a jobs x phrases hit matrix per field. All
+    five sub-scores, the weighted total and the deal-breaker check are then
+    computed column-wise, and result dictionaries are only built for the jobs
+    that pass. Output is identical to filtering and sorting
+    `scorer.score_job()` results.
+
+    Args:
+        scorer: JobScorer providing the criteria, weights and matcher
+        jobs: List of job dictionaries
+        passed_only: Set False to get every job's result, in input order
+
+    Returns:
+        Passing scored jobs sorted by total_score descending, or every
+        scored job in input order when passed_only is False
+    """
+    # Local import: scorer.py imports this module lazily
+    from analyzers.scorer import (
+        NOT_REMOTE_PHRASES, ONSITE_PHRASES, REMOTE_PHRASES, SCANNED_FIELDS, STARTUP_INDICATORS
+    )
+
+    if not jobs:
+        return []
+
+    column = {phrase: i for i, phrase in enumerate(sorted(scorer.matcher.phrases))}
+
+    def cols(phrases) -> np.ndarray:
+        # Keeps duplicates so counts match the per-phrase loops in JobScorer
+        return np.array([column[p] for p in phrases if p in column], dtype=np.intp)
+
+    # One boolean hit matrix per scanned field
+    hits = {field: np.zeros((len(jobs), len(column)), dtype=bool) for field in SCANNED_FIELDS}
+    rows = {field: [] for field in SCANNED_FIELDS}
+    hit_cols = {field: [] for field in SCANNED_FIELDS}
+
+    scans = [scorer.scan(job) for job in jobs]
+    for i, scan in enumerate(scans):
+        for field, found in scan.items():
+            rows[field].extend([i] * len(found))
+            hit_cols[field].extend(column[p] for p in found)
+
+    for field in SCANNED_FIELDS:
+        hits[field][rows[field], hit_cols[field]] = True
+
+    location_desc = hits['location'] | hits['description']
+    company_desc = hits['company'] | hits['description']
+
+    remote = np.where(
+        location_desc[:, cols(ONSITE_PHRASES)].any(axis=1), 0.0,
+        np.where(location_desc[:, cols(REMOTE_PHRASES)].any(axis=1), 1.0, 0.3)
+    )
+    industry = np.minimum(company_desc[:, cols(scorer.industries)].sum(axis=1) / 3, 1.0)
+    role = np.array([scorer._score_role(job) for job in jobs], dtype=float)
+    stage = np.where(
+        company_desc[:, cols(scorer.stages)].any(axis=1), 1.0,
+        np.where(company_desc[:, cols(STARTUP_INDICATORS)].any(axis=1), 0.8, 0.3)
+    )
+    skills = np.minimum(hits['description'][:, cols(scorer.skills)].sum(axis=1) / 5, 1.0)
+
+    # Accumulate in the same order as score_job() so totals match bit for bit
+    total = np.zeros(len(jobs))
+    for sub_score, weight in (
+        (remote, 'remote_match'),
+        (industry, 'industry_match'),
+        (role, 'role_match'),
+        (stage, 'company_stage_match'),
+        (skills, 'skills_match'),
+    ):
+        total = total + sub_score * scorer.weights[weight]
+
+    avoid = scorer.profile.avoid
+    has_deal_breaker = (
+        location_desc[:, cols(NOT_REMOTE_PHRASES)].any(axis=1) |
+        location_desc[:, cols(avoid)].any(axis=1)
+    )
+    passed = (total >= 0.5) & ~has_deal_breaker
+
+    scored_jobs = []
+    for i in (np.flatnonzero(passed) if passed_only else range(len(jobs))):
+        deal_breakers = scorer._check_deal_breakers(jobs[i], scans[i]) if has_deal_breaker[i] else []
+        scored_jobs.append({
+            'job': jobs[i],
+            'total_score': round(float(total[i]), 2),
+            'scores': {
+                'remote_score': float(remote[i]),
+                'industry_score': float(industry[i]),
+                'role_score': float(role[i]),
+                'company_stage_score': float(stage[i]),
+                'skills_score': float(skills[i])
+            },
+            'deal_breakers': deal_breakers,
+            'passed': bool(passed[i])
+        })
+
+    if passed_only:
+        scored_jobs.sort(key=lambda x: x['total_score'], reverse=True)
+    return scored_jobs
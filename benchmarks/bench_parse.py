@@ -0,0 +1,80 @@
+"""
+HTML Parsing Benchmark
+Compares a full html.parser tree with the strainer-restricted parse per source
+
+Usage:
+    python -m benchmarks.bench_parse [--repeat N] [--cards N]
+"""
+
+from typing import Callable, Tuple
+import argparse
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from benchmarks.fixtures import load_fixtures
+from scrapers.parsing import PARSER, parse_html
+from scrapers import (
+    eighty_thousand_hours, four_hour_workweek, indeed, linkedin, remote_ok, wellfound, yc_jobs
+)
+
+
+SPECS = {
+    'linkedin': linkedin.SPEC,
+    'indeed': indeed.SPEC,
+    'wellfound': wellfound.SPEC,
+    'remote_ok': remote_ok.SPEC,
+    'yc_jobs': yc_jobs.SPEC,
+    'four_hour_workweek': four_hour_workweek.SPEC,
+    'eighty_thousand_hours': eighty_thousand_hours.SPEC,
+}
+
+
+def find_cards(spec, soup) -> list:
+    """The cards the engine would read from a parsed page"""
+    for selector in spec.cards:
+        cards = selector.select(soup)
+        if cards:
+            return cards
+    return []
+
+
+def measure(parse: Callable, repeat: int) -> Tuple[float, int, object]:
+    """Return (best time in ms, peak traced memory in KB, last result)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak // 1024, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scraper HTML parsing')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case (best is reported)')
+    parser.add_argument('--cards', type=int, default=60, help='Cards per synthetic page')
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.cards)
+    print(f"Restricted parser: {PARSER}\n")
+    print(f"{'source':<24}{'KB':>6}{'full ms':>10}{'fast ms':>10}{'full KB':>10}{'fast KB':>10}{'cards':>8}")
+
+    for source, spec in SPECS.items():
+        page = pages[source]
+        full_ms, full_kb, full_soup = measure(lambda: BeautifulSoup(page, 'html.parser'), args.repeat)
+        fast_ms, fast_kb, fast_soup = measure(lambda: parse_html(page, spec.strainer), args.repeat)
+
+        full_cards, fast_cards = len(find_cards(spec, full_soup)), len(find_cards(spec, fast_soup))
+        cards = str(fast_cards) if full_cards == fast_cards else f'{fast_cards}!={full_cards}'
+        print(f"{source:<24}{len(page) // 1024:>6}{full_ms:>10.2f}{fast_ms:>10.2f}"
+              f"{full_kb:>10}{fast_kb:>10}{cards:>8}")
+
+
+if __name__ == '__main__':
+    main()
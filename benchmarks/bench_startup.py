@@ -0,0 +1,95 @@
+"""
+CLI Startup Benchmark
+Times how long main.py takes to start for commands that don't scrape
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat N]
+"""
+
+from pathlib import Path
+from typing import List
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from storage.search_index import SearchIndex
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Invocations timed, as arguments to main.py. "all sources" is what every
+# command used to pay when main.py imported the scrapers eagerly.
+CASES = [
+    ('--help', ['main.py', '--help']),
+    ('--search', ['main.py', '--search', 'operations']),
+    ('--replay (empty archive)', ['main.py', '--replay']),
+    ('all sources', ['-c', 'from scrapers.registry import load_sources; load_sources()']),
+]
+
+# Modules worth knowing about when they show up in a command that doesn't need them
+HEAVY_MODULES = ('requests', 'bs4', 'lxml', 'soupsieve', 'numpy', 'pyarrow')
+
+
+def run(args: List[str], cwd: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + args
+    if args[0] == 'main.py':
+        command[command.index('main.py')] = str(REPO_DIR / 'main.py')
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True,
+                            env={**os.environ, 'PYTHONPATH': str(REPO_DIR)})
+    # A command that fails early would look fast; don't time it
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {result.returncode}:\n{result.stderr}")
+    return result
+
+
+def seed_search_index(cwd: str):
+    """A small data/jobs.db, so --search runs a real query"""
+    index = SearchIndex(str(Path(cwd) / 'data' / 'jobs.db'))
+    index.add([
+        {'title': f'Operations Manager {i}', 'company': f'Company {i}', 'location': 'Remote',
+         'description': 'Remote operations role at a fintech startup', 'source': 'LinkedIn',
+         'url': f'https://example.com/jobs/{i}'}
+        for i in range(200)
+    ], '2026-01-01')
+    index.close()
+
+
+def heavy_imports(args: List[str], cwd: str) -> List[str]:
+    """Heavy top-level packages the command imports"""
+    stderr = run(args, cwd, importtime=True).stderr
+    loaded = set()
+    for line in stderr.splitlines():
+        if line.startswith('import time:'):
+            name = line.rsplit('|', 1)[-1].strip()
+            if name in HEAVY_MODULES:
+                loaded.add(name)
+    return sorted(loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark main.py startup time')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per command')
+    args = parser.parse_args()
+
+    # A scratch working directory, so nothing touches the real data
+    with tempfile.TemporaryDirectory() as cwd:
+        (Path(cwd) / 'config.json').write_bytes((REPO_DIR / 'config.json').read_bytes())
+        seed_search_index(cwd)
+
+        print(f"{'command':<26}{'median ms':>11}{'min ms':>9}  heavy imports")
+        for name, case in CASES:
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run(case, cwd)
+                times.append((time.perf_counter() - start) * 1000)
+            heavy = ', '.join(heavy_imports(case, cwd)) or '-'
+            print(f"{name:<26}{statistics.median(times):>11.1f}{min(times):>9.1f}  {heavy}")
+
+
+if __name__ == '__main__':
+    main()
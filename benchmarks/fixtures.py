@@ -0,0 +1,122 @@
+"""
+Benchmark Fixtures
+Saved or synthetic search pages for each source
+"""
+
+from pathlib import Path
+from typing import Dict, List
+import random
+
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+
+# Card markup per source, shaped like the elements each spec reads
+CARD_TEMPLATES = {
+    'linkedin': (
+        '<div class="base-card job-search-card">'
+        '<h3 class="base-search-card__title">Operations Manager {i}</h3>'
+        '<h4 class="base-search-card__subtitle">Startup {i}</h4>'
+        '<span class="job-search-card__location">Remote</span>'
+        '<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}">View</a>'
+        '</div>'
+    ),
+    'indeed': (
+        '<div class="job_seen_beacon"><h2 class="jobTitle"><a class="jcs-JobTitle" data-jk="{i}">'
+        '<span>Chief of Staff {i}</span></a></h2>'
+        '<span class="companyName">Company {i}</span>'
+        '<div class="companyLocation">Remote</div>'
+        '<div class="job-snippet"><ul><li>Own planning and operations</li></ul></div></div>'
+    ),
+    'wellfound': (
+        '<div data-test="JobSearchResult"><div data-test="company-name">Startup {i}</div>'
+        '<a href="/jobs/{i}"><h2>Head of Operations {i}</h2></a><span>Remote</span></div>'
+    ),
+    'remote_ok': (
+        '<tr class="job" data-url="/remote-jobs/{i}"><td class="company position">'
+        '<a itemprop="url" href="/remote-jobs/{i}"><h2 itemprop="title">Operations Lead {i}</h2></a>'
+        '<h3 itemprop="name">Company {i}</h3><div class="location">Worldwide</div></td></tr>'
+    ),
+    'yc_jobs': (
+        '<div class="job-listing"><h2>Business Operations {i}</h2>'
+        '<span class="company">YC Startup {i}</span><span class="location">Remote</span>'
+        '<p>Help us scale support</p><a href="/jobs/{i}">Apply</a></div>'
+    ),
+    'four_hour_workweek': (
+        '<p><a href="https://jobs.example.com/{i}">Remote Operations Manager {i}</a></p>'
+    ),
+    'eighty_thousand_hours': (
+        '<article class="job-board__job"><h3>Program Operations Lead {i}</h3>'
+        '<div class="organisation">Nonprofit {i}</div><a href="/job/{i}">Details</a>'
+        '<p>Remote</p></article>'
+    ),
+}
+
+# Navigation, filters, scripts and footer that surround the cards on a real page
+PAGE_NOISE = (
+    '<nav>' + ''.join(f'<ul><li><span class="nav-item">Section {n}</span></li></ul>' for n in range(80)) + '</nav>'
+    '<aside class="filters">'
+    + ''.join(f'<label><input type="checkbox" name="f{n}"> Filter option {n}</label>' for n in range(150))
+    + '</aside>'
+    + ''.join(f'<script>window.__state{n} = {{"k": {n}, "items": [1, 2, 3]}};</script>' for n in range(40))
+    + '<footer>' + ''.join(f'<div class="footer-col"><p>Footer text {n}</p></div>' for n in range(120)) + '</footer>'
+)
+
+
+def synthetic_page(source: str, cards: int = 60) -> bytes:
+    """Build a search results page with `cards` job cards and typical page chrome"""
+    body = ''.join(CARD_TEMPLATES[source].format(i=i) for i in range(cards))
+    if source == 'remote_ok':
+        body = f'<table id="jobsboard">{body}</table>'
+    html = f'<html><head><title>{source}</title></head><body>{PAGE_NOISE}<main>{body}</main>{PAGE_NOISE}</body></html>'
+    return html.encode('utf-8')
+
+
+def load_fixtures(cards: int = 60) -> Dict[str, bytes]:
+    """
+    Load a page for every source
+
+    A saved page at benchmarks/fixtures/<source>.html is used when present,
+    otherwise a synthetic page is built.
+    """
+    pages = {}
+    for source in CARD_TEMPLATES:
+        path = FIXTURE_DIR / f'{source}.html'
+        pages[source] = path.read_bytes() if path.exists() else synthetic_page(source, cards)
+    return pages
+
+
+# Vocabulary for synthetic jobs: mostly filler, with enough role, industry,
+# remote and skills phrases that a realistic share of jobs pass the filters
+_TITLES = [
+    'Operations Manager', 'Customer Experience Manager', 'Implementation Manager',
+    'Product Manager - Internal Tools', 'Software Engineer', 'Account Executive',
+    'Head of Customer Success', 'Data Analyst', 'Office Manager', 'Designer',
+]
+_LOCATIONS = ['Remote', 'Remote - US', 'New York, NY', 'Hybrid - Austin', 'Anywhere', 'On-site, London']
+_PHRASES = [
+    'fintech', 'payments', 'e-commerce', 'saas', 'wellness', 'outdoor', 'seed stage',
+    'series a', 'startup', 'sql', 'zendesk', 'process improvement', 'cross-functional',
+    'must relocate', 'security clearance', 'fully remote', 'work from anywhere',
+]
+_FILLER = (
+    'we are looking for a motivated person to join our growing team and help '
+    'shape how we work with customers partners and each other every day'
+).split()
+
+
+def synthetic_jobs(n: int, seed: int = 0) -> List[Dict]:
+    """Deterministic job dictionaries for scoring benchmarks"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        words = rng.choices(_FILLER, k=rng.randint(20, 120)) + rng.sample(_PHRASES, rng.randint(0, 4))
+        rng.shuffle(words)
+        jobs.append({
+            'title': rng.choice(_TITLES),
+            'company': f'Company {rng.randint(0, n // 3 + 1)}',
+            'location': rng.choice(_LOCATIONS),
+            'description': ' '.join(words),
+            'url': f'https://example.com/jobs/{i}',
+            'source': 'Synthetic',
+        })
+    return jobs
@@ -0,0 +1,50 @@
+"""
+Fixture Recorder
+Saves one real search results page per source for offline benchmarks
+
+Usage:
+    python -m benchmarks.record [source ...]
+"""
+
+import argparse
+import logging
+
+from benchmarks.bench_parse import SPECS
+from benchmarks.fixtures import FIXTURE_DIR
+from scrapers.session import fetch
+
+
+# A representative search per source; sources without queries ignore it
+RECORD_QUERIES = {
+    'linkedin': 'Operations Manager remote',
+    'indeed': 'Operations Manager remote',
+    'wellfound': 'operations',
+    'remote_ok': 'operations',
+    'yc_jobs': 'operations',
+    'four_hour_workweek': 'https://www.fourhourworkweek.com/blog/jobs/',
+    'eighty_thousand_hours': '',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record benchmark fixture pages')
+    parser.add_argument('sources', nargs='*', default=list(SPECS), help='Sources to record (default: all)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    FIXTURE_DIR.mkdir(exist_ok=True)
+
+    for source in args.sources:
+        url = SPECS[source].page_url(RECORD_QUERIES[source], 0)
+        try:
+            response = fetch(url)
+        except Exception as e:
+            logging.error(f"Could not record {source} from {url}: {e}")
+            continue
+        path = FIXTURE_DIR / f'{source}.html'
+        path.write_bytes(response.content)
+        print(f"{source}: {len(response.content) // 1024} KB -> {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Benchmark Suite
+Times the fetch, parse, extract and scoring hot paths offline and keeps the
+results so runs can be compared across commits
+
+Usage:
+    python -m benchmarks.run [--sizes 1000 10000 100000] [--no-memory]
+    python -m benchmarks.run --compare [RESULTS_FILE]
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from benchmarks.bench_parse import SPECS, find_cards
+from benchmarks.fixtures import load_fixtures, synthetic_jobs
+from benchmarks.stub_server import serve_fixtures
+from analyzers.parallel import ScoringPool
+from analyzers.profile import ScoringProfile
+from analyzers.scorer import PARALLEL_MIN_JOBS, VECTORIZE_MIN_JOBS, JobScorer, score_jobs_batch
+from scrapers.engine import parse_cards
+from scrapers.parsing import PARSER, parse_html
+from scrapers.session import configure_cache, fetch
+
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Page benchmarks repeat until at least this much time has passed
+MIN_SECONDS = 0.5
+
+# Throughput changes beyond this fraction are flagged when comparing
+REGRESSION_THRESHOLD = 0.10
+
+
+def run_case(stage: str, case: str, work: Callable[[], int], memory: bool,
+             min_seconds: float = 0.0) -> Dict:
+    """
+    Time one benchmark case
+
+    Args:
+        stage: Hot path being measured
+        case: Source name or batch size
+        work: Runs the case once and returns the number of items processed
+        memory: Also measure peak traced memory in a separate run
+        min_seconds: Repeat the case until this much time has passed
+
+    Returns:
+        Result record
+    """
+    items, runs = 0, 0
+    start = time.perf_counter()
+    while True:
+        items += work()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+
+    result = {
+        'stage': stage,
+        'case': case,
+        'runs': runs,
+        'seconds': round(elapsed / runs, 6),
+        'items': items // runs,
+        'per_second': round(items / elapsed, 1) if elapsed else 0.0,
+        'peak_kb': None,
+    }
+
+    if memory:
+        tracemalloc.start()
+        work()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['peak_kb'] = peak // 1024
+
+    return result
+
+
+def page_benchmarks(memory: bool) -> List[Dict]:
+    """Fetch, parse and extract every source's fixture page"""
+    pages = load_fixtures()
+    results = []
+
+    # No disk cache or politeness delay: this measures the client itself
+    configure_cache(None)
+    with serve_fixtures(pages) as base_url:
+        for source in SPECS:
+            url = f'{base_url}/{source}'
+
+            def fetch_page() -> int:
+                fetch(url, throttle=False)
+                return 1
+
+            results.append(run_case('fetch', source, fetch_page, memory, MIN_SECONDS))
+
+    for source, spec in SPECS.items():
+        page = pages[source]
+        results.append(run_case(
+            'parse', source, lambda: len(find_cards(spec, parse_html(page, spec.strainer))),
+            memory, MIN_SECONDS
+        ))
+        results.append(run_case(
+            'extract', source, lambda: len(parse_cards(spec, page, f'https://example.com/{source}')),
+            memory, MIN_SECONDS
+        ))
+
+    return results
+
+
+def scoring_benchmarks(sizes: List[int], memory: bool) -> List[Dict]:
+    """Score synthetic batches one job at a time, through score_jobs_batch and across a ScoringPool"""
+    results = []
+    # Pay the one-off NumPy import before anything is timed
+    score_jobs_batch(synthetic_jobs(VECTORIZE_MIN_JOBS, seed=1), vectorized=True)
+
+    with open('config.json') as f:
+        config = json.load(f)
+
+    for size in sizes:
+        jobs = synthetic_jobs(size)
+        # A freshly compiled profile per case, so no case profits from
+        # another's matcher memo
+        each_scorer, batch_scorer = (JobScorer(profile=ScoringProfile(config)) for _ in range(2))
+
+        def score_each() -> int:
+            for job in jobs:
+                each_scorer.score_job(job)
+            return len(jobs)
+
+        def score_batch() -> int:
+            score_jobs_batch(jobs, scorer=batch_scorer)
+            return len(jobs)
+
+        results.append(run_case('score_job', str(size), score_each, memory))
+        results.append(run_case('score_jobs_batch', str(size), score_batch, memory))
+
+    # Workers are started and warmed up once, as a long-running caller would
+    parallel_sizes = [size for size in sizes if size >= PARALLEL_MIN_JOBS]
+    if parallel_sizes:
+        with ScoringPool() as pool:
+            score_jobs_batch(synthetic_jobs(PARALLEL_MIN_JOBS, seed=1), pool=pool)
+            for size in parallel_sizes:
+                jobs = synthetic_jobs(size)
+
+                def score_pooled() -> int:
+                    score_jobs_batch(jobs, pool=pool)
+                    return len(jobs)
+
+                results.append(run_case('score_jobs_batch[pool]', str(size), score_pooled, memory))
+
+    return results
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def save_results(results: List[Dict]) -> Path:
+    RESULTS_DIR.mkdir(exist_ok=True)
+    commit = current_commit()
+    report = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'parser': PARSER,
+        'results': results,
+    }
+    path = RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{commit}.json"
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+
+def previous_results(exclude: Optional[Path] = None) -> Optional[Path]:
+    """Most recent stored results file other than `exclude`"""
+    if not RESULTS_DIR.exists():
+        return None
+    candidates = sorted(p for p in RESULTS_DIR.glob('*.json') if p != exclude)
+    return candidates[-1] if candidates else None
+
+
+def print_results(results: List[Dict], baseline: Optional[Dict] = None):
+    """Print a results table, with throughput change against a baseline report"""
+    before = {}
+    if baseline:
+        before = {(r['stage'], r['case']): r for r in baseline['results']}
+        print(f"Compared with {baseline['commit']} ({baseline['timestamp']})\n")
+
+    print(f"{'stage':<24}{'case':<24}{'ms/run':>10}{'items/s':>12}{'peak KB':>10}{'change':>9}")
+    for r in results:
+        change = ''
+        old = before.get((r['stage'], r['case']))
+        if old and old['per_second']:
+            delta = r['per_second'] / old['per_second'] - 1
+            change = f'{delta:+.0%}' + (' !' if delta < -REGRESSION_THRESHOLD else '')
+        peak = '' if r['peak_kb'] is None else str(r['peak_kb'])
+        print(f"{r['stage']:<24}{r['case']:<24}{r['seconds'] * 1000:>10.2f}"
+              f"{r['per_second']:>12.0f}{peak:>10}{change:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scraping and scoring hot paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Synthetic batch sizes for the scoring benchmarks')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement')
+    parser.add_argument('--skip-pages', action='store_true', help='Only run the scoring benchmarks')
+    parser.add_argument('--compare', nargs='?', const='', metavar='RESULTS_FILE',
+                        help='Show a stored report against its predecessor (or the given file) '
+                             'without running anything')
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        current = previous_results()
+        if current is None:
+            print("No stored results")
+            return
+        baseline_path = Path(args.compare) if args.compare else previous_results(exclude=current)
+        baseline = json.loads(baseline_path.read_text()) if baseline_path else None
+        print_results(json.loads(current.read_text())['results'], baseline)
+        return
+
+    memory = not args.no_memory
+    results = [] if args.skip_pages else page_benchmarks(memory)
+    results += scoring_benchmarks(args.sizes, memory)
+
+    baseline_path = previous_results()
+    path = save_results(results)
+    print_results(results, json.loads(baseline_path.read_text()) if baseline_path else None)
+    print(f"\nResults saved to {path}")
+
+
+if __name__ == '__main__':
+    main()
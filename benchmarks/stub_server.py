@@ -0,0 +1,49 @@
+"""
+Stub HTTP Server
+Serves fixture pages locally so fetch benchmarks never touch the network
+"""
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+import threading
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    pages: Dict[str, bytes] = {}
+
+    def do_GET(self):
+        body = self.pages.get(self.path.split('?')[0].strip('/'))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_fixtures(pages: Dict[str, bytes]) -> Iterator[str]:
+    """
+    Serve each page at /<name> on a free localhost port
+
+    Args:
+        pages: Page name -> raw HTML
+
+    Yields:
+        Base URL of the server, e.g. http://127.0.0.1:54321
+    """
+    handler = type('FixtureHandler', (_FixtureHandler,), {'pages': dict(pages)})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_address[1]}'
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -5,111 +5,287 @@ Runs daily scraping, analysis, and summary generation
 """
 
 import argparse
-import json
+import io
 import logging
 import os
-from datetime import datetime
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 
-# Import scrapers and analyzers
-from scrapers.yc_jobs import scrape_yc_jobs
-from scrapers.linkedin import scrape_linkedin_jobs
-from scrapers.indeed import scrape_indeed_jobs
-from scrapers.wellfound import scrape_wellfound_jobs
-from scrapers.four_hour_workweek import scrape_4hw_jobs
-from scrapers.eighty_thousand_hours import scrape_80k_hours_jobs
-from scrapers.remote_ok import scrape_remote_ok_jobs
-from analyzers.scorer import score_jobs_batch
-
-# Create logs directory before setting up logging
-os.makedirs('logs', exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/agent.log'),
-        logging.StreamHandler()
-    ]
-)
-
-
-def generate_summary(scored_jobs: list, date: str) -> str:
+# Only what every command needs is imported here. Scrapers (and with them
+# requests, bs4 and lxml) are loaded from the source registry, and other
+# heavy modules inside the command that uses them, so --help, --search and
+# --replay start quickly.
+from pipeline.stages import RunStats
+from scrapers.registry import load_sources, source_names
+
+# Jobs handed to the seen-store, detail and scoring stages at a time
+CHUNK_SIZE = 200
+
+
+def setup_logging():
+    """Log to the console and to logs/agent.log"""
+    os.makedirs('logs', exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('logs/agent.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def generate_summary(scored_jobs: list, date: str, stats: RunStats = None) -> str:
     """
     Generate a markdown summary of job search results
     
     Args:
-        scored_jobs: List of scored job dictionaries
+        scored_jobs: Scored job dictionaries, best first; only the top 10 are listed
         date: Date string (YYYY-MM-DD)
+        stats: Counts and score aggregates for the whole run; computed from
+            scored_jobs when omitted
     
     Returns:
         Markdown formatted summary
     """
-    summary = f"""# Job Search Summary - {date}
+    from pipeline.render import MarkdownWriter, render
 
-## 🎯 Overview
+    if stats is None:
+        stats = RunStats.from_results(scored_jobs)
+    
+    out = io.StringIO()
+    render(scored_jobs, date, stats, [MarkdownWriter(out)], limit=10)
+    return out.getvalue()
 
-Found **{len(scored_jobs)}** matching jobs today!
 
-"""
-    
-    if not scored_jobs:
-        summary += """No jobs found matching your criteria today. The search continues tomorrow!
+def summary_formats(args: argparse.Namespace) -> list:
+    """Summary formats asked for with --format; Markdown is always written, first"""
+    return ['md'] + [extension for extension in args.format or [] if extension != 'md']
 
-### Next Steps
-- Scrapers will run again tomorrow
-- Check back for new opportunities
-"""
-        return summary
-    
-    # Top 10 jobs
-    summary += "## 🌟 Top Opportunities\n\n"
-    
-    for i, job_result in enumerate(scored_jobs[:10], 1):
-        job = job_result['job']
-        score = job_result['total_score']
-        scores = job_result['scores']
-        
-        summary += f"""### {i}. {job['title']} at {job['company']}
 
-**Score:** {score}/1.0  
-**Location:** {job['location']}  
-**Source:** {job['source']}  
-**URL:** {job['url']}
+def run_daily_summary(args: argparse.Namespace, data_dir: Path = Path('data'),
+                      summaries_dir: Path = Path('summaries')):
+    """
+    Scrape, score and summarize today's jobs
 
-**Why it's a match:**
-- Remote Match: {scores['remote_score']:.0%}
-- Industry Match: {scores['industry_score']:.0%}
-- Role Match: {scores['role_score']:.0%}
-- Skills Match: {scores['skills_score']:.0%}
+    Args:
+        args: Parsed command line options
+        data_dir: Folder for the archive, the seen-jobs database and the score cache
+        summaries_dir: Folder the summary (and run report) is written to
+    """
+    from analyzers.score_cache import ScoreCache
+    from analyzers.scorer import JobScorer, score_jobs_batch
+    from pipeline import metrics
+    from pipeline.render import write_summary
+    from pipeline.rollups import ROLLUP_TOP, Rollup, RollupStore, period_of, write_digest
+    from pipeline.stages import TopN, chunked, dedupe_stream
+    from scrapers.details import fetch_descriptions
+    from scrapers.engine import configure_checkpoints, configure_known_postings
+    from scrapers.scheduler import iter_scrapers
+    from storage.archive import JobArchive
+    from storage.checkpoints import CheckpointStore
+    from storage.descriptions import DescriptionStore
+    from storage.search_index import SearchIndex
+    from storage.seen_jobs import SeenJobsStore
 
----
+    logging.info("Running daily summary workflow")
+
+    # Create directories if they don't exist
+    summaries_dir.mkdir(parents=True, exist_ok=True)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    Path('logs').mkdir(exist_ok=True)
+
+    today = datetime.now().strftime('%Y-%m-%d')
+    run_metrics = metrics.enable_metrics() if args.metrics or args.prometheus else None
+
+    # Every finished source query is checkpointed, so a re-run today only
+    # scrapes what is missing
+    checkpoints = CheckpointStore(today, str(data_dir / 'checkpoints'))
+    if args.no_resume:
+        checkpoints.clear()
+    configure_checkpoints(checkpoints)
+
+    # 1. Scrape jobs from all sources, streaming them through the
+    #    pipeline as each results page comes in
+    stats = Rollup(max(ROLLUP_TOP, args.top))
+    jobs = iter_scrapers(load_sources(args.source), max_workers=args.max_workers,
+                         timeout=args.source_timeout)
+    jobs = stats.count_scraped(jobs)
+
+    # Save raw data
+    archive = JobArchive(str(data_dir / 'archive'))
+    jobs = archive.record(jobs, today)
+
+    # Keep the full-text index of everything ever scraped up to date; it
+    # takes every archived posting, duplicates included, like --backfill
+    search_index = SearchIndex(str(data_dir / 'jobs.db'))
+
+    def index(jobs):
+        for chunk in chunked(jobs, CHUNK_SIZE):
+            with metrics.timer('stage_seconds', stage='index'):
+                search_index.add(chunk, today)
+            yield from chunk
+
+    jobs = index(jobs)
+
+    # 2. Drop postings seen on several boards or under several keywords
+    jobs = dedupe_stream(jobs)
+
+    scorer = JobScorer()
+    seen_store = SeenJobsStore(str(data_dir / 'jobs.db'))
+    # Paging stops at the first page of postings from earlier runs, unless
+    # those are wanted too
+    configure_known_postings(None if args.include_seen else seen_store, today)
+    score_cache = ScoreCache(str(data_dir / 'score_cache.json'))
+    description_store = DescriptionStore(str(data_dir / 'jobs.db')) if args.fetch_details else None
+    top_jobs = TopN(args.top)
+    formats = summary_formats(args)
+
+    def score(new_jobs: list):
+        # 3. Score and filter jobs
+        with metrics.timer('stage_seconds', stage='score'):
+            results = score_jobs_batch(new_jobs, cache=score_cache, scorer=scorer)
+        metrics.count('stage_jobs', len(new_jobs), stage='score')
+        for result in results:
+            stats.add_match(result)
+            top_jobs.push(result)
+
+    # With --fetch-details, new jobs wait for the whole run, so the fetch
+    # budget goes to the best titles of the day rather than of the first chunk
+    awaiting_details = []
+
+    for chunk in chunked(jobs, CHUNK_SIZE):
+        # Only postings that are new or changed since earlier runs go on
+        with metrics.timer('stage_seconds', stage='seen'):
+            new_jobs, _ = seen_store.classify(chunk, today)
+        if args.include_seen:
+            new_jobs = chunk
+
+        if description_store is not None:
+            awaiting_details.extend(new_jobs)
+        else:
+            score(new_jobs)
+
+    if description_store is not None:
+        # Fill in descriptions for the jobs whose titles look most promising
+        with metrics.timer('stage_seconds', stage='details'):
+            fetch_descriptions(awaiting_details, budget=args.fetch_details,
+                               scorer=scorer, store=description_store)
+        with metrics.timer('stage_seconds', stage='index'):
+            search_index.add([job for job in awaiting_details if job.get('description')], today)
+        for chunk in chunked(awaiting_details, CHUNK_SIZE):
+            score(chunk)
+
+    configure_known_postings(None)
+    seen_store.close()
+    # Every job of today's archive went through add(), so --backfill can skip the day
+    search_index.mark_indexed(archive, today)
+    search_index.close()
+    if description_store is not None:
+        description_store.close()
+    score_cache.save()
+    if args.columnar:
+        with metrics.timer('stage_seconds', stage='export'):
+            try:
+                archive.export_columnar(today)
+            except ImportError as e:
+                logging.warning(f"Skipping the columnar export: {e}")
+    logging.info(f"Total jobs scraped from all sources: {stats.scraped}")
+    logging.info(f"Found {stats.matched} good matches")
+
+    # 4. Generate summary
+    with metrics.timer('stage_seconds', stage='summary'):
+        summary_file, *extra_files = write_summary(top_jobs.results(), today, stats,
+                                                   summaries_dir / today, formats=formats)
+
+    logging.info(f"Summary written to {', '.join(map(str, [summary_file] + extra_files))}")
+
+    # 5. Fold today into the week's and month's digests
+    with metrics.timer('stage_seconds', stage='rollup'):
+        rollups = RollupStore(str(data_dir / 'rollups'))
+        rollups.record(today, stats)
+        for kind in ('week', 'month'):
+            write_digest(rollups, period_of(today, kind), summaries_dir, formats, args.top)
+
+    if run_metrics is not None:
+        run_metrics.count('jobs_scraped', stats.scraped)
+        run_metrics.count('jobs_matched', stats.matched)
+        report_file = run_metrics.write_json(summaries_dir / f'{today}.metrics.json')
+        logging.info(f"Run report written to {report_file}")
+        if args.prometheus:
+            run_metrics.write_prometheus(summaries_dir / f'{today}.prom')
+
+    print(f"📊 Daily summary generated at {summary_file}")
+    print(f"✅ Found {stats.matched} matching jobs!")
+
+
+def run_profile(args: argparse.Namespace):
+    """
+    Run the daily flow offline under the sampling profiler
+
+    Pages come from the benchmark fixtures, or from the HTTP cache with
+    `--profile cache`. The run works in a scratch folder, so the archive, the
+    seen-jobs database and the summaries are left untouched.
+    """
+    from pipeline.profiling import SamplingProfiler, fixture_pages_by_host, use_fixture_pages
+    from scrapers.session import configure_cache
+
+    if args.profile == 'cache':
+        configure_cache(str(Path('data') / 'http_cache'), offline=True)
+    else:
+        configure_cache(None)
+        use_fixture_pages(fixture_pages_by_host())
+
+    with tempfile.TemporaryDirectory(prefix='job-agent-profile-') as scratch:
+        with SamplingProfiler() as profiler:
+            run_daily_summary(args, Path(scratch) / 'data', Path(scratch) / 'summaries')
+
+    report_file = profiler.write(Path('logs') / f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt")
+    logging.info(f"Profile written to {report_file}")
+    print(f"🔍 Profile written to {report_file}")
+
+
+def run_digest(args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Rebuild a weekly or monthly digest from the saved day aggregates"""
+    from pipeline.rollups import RollupStore, period_of, write_digest
+
+    period = args.digest
+    if period in ('week', 'month'):
+        period = period_of(datetime.now().strftime('%Y-%m-%d'), period)
+    try:
+        paths = write_digest(RollupStore(str(Path('data') / 'rollups')), period, Path('summaries'),
+                             summary_formats(args), args.top)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"📊 Digest written to {paths[0]}")
+
+
+def run_replay(args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Regenerate summaries for archived days from their raw jobs"""
+    from pipeline.replay import replay_archive
+    from storage.archive import JobArchive
+
+    if len(args.replay) > 2:
+        parser.error('--replay takes at most two dates (START END)')
+    start = args.replay[0] if args.replay else None
+    end = args.replay[-1] if args.replay else None
+
+    dates = JobArchive(str(Path('data') / 'archive')).dates(start, end)
+    if not dates:
+        print("No archived days to replay")
+        return
+
+    logging.info(f"Replaying {len(dates)} archived days")
+    results = replay_archive(dates, summary_formats(args), args.top,
+                             archive_dir=str(Path('data') / 'archive'),
+                             output_dir=args.replay_output, processes=args.processes)
+
+    for result in results:
+        print(f"{result['date']}: {result['matched']} matches from {result['unique']} unique jobs "
+              f"(top score {result['top_score']:.2f})")
+    print(f"📊 {len(results)} summaries regenerated in {args.replay_output}")
 
-"""
-    
-    # Stats
-    summary += f"""## 📊 Statistics
-
-- Total jobs scraped: {len(scored_jobs)}
-- Jobs meeting criteria: {len(scored_jobs)}
-- Average score: {sum(j['total_score'] for j in scored_jobs) / len(scored_jobs):.2f}
-- Top score: {max(j['total_score'] for j in scored_jobs):.2f}
-
-## 🛠️ Sources
-
-- LinkedIn
-- Indeed
-- Wellfound (AngelList)
-- Y Combinator Work at a Startup
-- 4-Hour Workweek Job Board
-- 80,000 Hours
-- Remote OK
-
----
-*Generated automatically by Job Search Agent*
-"""
-    
-    return summary
 
 def main():
     parser = argparse.ArgumentParser(description='Job Search Automation Agent')
@@ -119,94 +295,79 @@ def main():
                        help='Only scrape, no summary')
     parser.add_argument('--company', type=str,
                        help='Scrape specific company')
+    parser.add_argument('--source', action='append', type=str.lower, metavar='NAME',
+                       choices=[name.lower() for name in source_names()],
+                       help='Only scrape this source (any case); repeat for several '
+                            f"(default: all of {', '.join(source_names())})")
+    parser.add_argument('--max-workers', type=int, default=4,
+                       help='Maximum number of sources scraped at once')
+    parser.add_argument('--source-timeout', type=float, default=300,
+                       help='Seconds before a single source is abandoned')
+    parser.add_argument('--offline', action='store_true',
+                       help='Use only cached pages from data/http_cache, no network')
+    parser.add_argument('--include-seen', action='store_true',
+                       help='Score and summarize jobs already seen on earlier days')
+    parser.add_argument('--fetch-details', type=int, default=0, metavar='N',
+                       help='Fetch full descriptions for up to N of the most promising jobs')
+    parser.add_argument('--columnar', action='store_true',
+                       help="Also export today's raw jobs as an Arrow file (needs pyarrow)")
+    parser.add_argument('--top', type=int, default=10,
+                       help='Number of jobs listed in the summary')
+    parser.add_argument('--format', action='append', choices=['md', 'html', 'json'],
+                       help='Also write the summary as HTML or a JSON Feed; repeat for several')
+    parser.add_argument('--digest', metavar='PERIOD',
+                       help='Rebuild a digest from the daily aggregates: a week (2026-W42), '
+                            'a month (2026-10), or "week"/"month" for the current one')
+    parser.add_argument('--search', metavar='QUERY',
+                       help='Search every job scraped so far, e.g. "remote fintech operations"')
+    parser.add_argument('--days', type=int,
+                       help='With --search, only jobs seen in the last N days')
+    parser.add_argument('--limit', type=int, default=20,
+                       help='With --search, maximum number of hits')
+    parser.add_argument('--no-resume', action='store_true',
+                       help="Ignore today's checkpoints and scrape every source from scratch")
+    parser.add_argument('--metrics', action='store_true',
+                       help='Write a JSON run report with per-source, HTTP and stage timings')
+    parser.add_argument('--prometheus', action='store_true',
+                       help='Also write the run metrics as a Prometheus textfile (implies --metrics)')
+    parser.add_argument('--profile', nargs='?', const='fixtures', choices=['fixtures', 'cache'],
+                       help='Profile the daily flow offline against fixture pages (default) or '
+                            'cached pages and write per-phase hot spots to logs/')
+    parser.add_argument('--replay', nargs='*', metavar='DATE',
+                       help='Re-score archived days with the current config, without scraping: '
+                            'every day, one DATE, or a START END range')
+    parser.add_argument('--replay-output', default=str(Path('summaries') / 'replay'),
+                       help='Folder for summaries regenerated by --replay')
+    parser.add_argument('--processes', type=int, default=None,
+                       help='Worker processes for --replay (default: one per CPU)')
     
     args = parser.parse_args()
     
+    setup_logging()
     logging.info("Starting Job Search Agent")
     
-    if args.daily_summary:
-        logging.info("Running daily summary workflow")
-        
-        # Create directories if they don't exist
-        Path('summaries').mkdir(exist_ok=True)
-        Path('data').mkdir(exist_ok=True)
-        Path('logs').mkdir(exist_ok=True)
-        
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        # 1. Scrape jobs from all sources
-        all_jobs = []
-        
-        logging.info("Scraping LinkedIn jobs...")
-        try:
-            linkedin_jobs = scrape_linkedin_jobs()
-            all_jobs.extend(linkedin_jobs)
-        except Exception as e:
-            logger.error(f"LinkedIn scraper failed: {e}")
-        
-        logging.info("Scraping Indeed jobs...")
-        try:
-            indeed_jobs = scrape_indeed_jobs()
-            all_jobs.extend(indeed_jobs)
-        except Exception as e:
-            logger.error(f"Indeed scraper failed: {e}")
-        
-        logging.info("Scraping Wellfound jobs...")
-        try:
-            wellfound_jobs = scrape_wellfound_jobs()
-            all_jobs.extend(wellfound_jobs)
-        except Exception as e:
-            logger.error(f"Wellfound scraper failed: {e}")
-        
-        logging.info("Scraping YC jobs...")
-        try:
-            yc_jobs = scrape_yc_jobs()
-            all_jobs.extend(yc_jobs)
-        except Exception as e:
-            logger.error(f"YC scraper failed: {e}")
-        
-        logging.info("Scraping 4-Hour Workweek jobs...")
-        try:
-            hw4_jobs = scrape_4hw_jobs()
-            all_jobs.extend(hw4_jobs)
-        except Exception as e:
-            logger.error(f"4HW scraper failed: {e}")
-        
-        logging.info("Scraping 80,000 Hours jobs...")
-        try:
-            eighty_k_jobs = scrape_80k_hours_jobs()
-            all_jobs.extend(eighty_k_jobs)
-        except Exception as e:
-            logger.error(f"80k Hours scraper failed: {e}")
-        
-        logging.info("Scraping Remote OK jobs...")
-        try:
-            remote_ok_jobs = scrape_remote_ok_jobs()
-            all_jobs.extend(remote_ok_jobs)
-        except Exception as e:
-            logger.error(f"Remote OK scraper failed: {e}")
-        
-        logging.info(f"Total jobs scraped from all sources: {len(all_jobs)}")
+    if args.search:
+        from storage.search_index import SearchIndex, print_hits
+        index = SearchIndex(str(Path('data') / 'jobs.db'))
+        since = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d') if args.days is not None else None
+        print_hits(index.search(args.search, since=since, limit=args.limit))
+        index.close()
         
-        # Save raw data
-        data_file = Path('data') / f'jobs_{today}.json'
-        with open(data_file, 'w') as f:
-            json.dump(all_jobs, f, indent=2)
-        logging.info(f"Saved {len(all_jobs)} raw jobs to {data_file}")
+    elif args.digest:
+        run_digest(args, parser)
         
-        # 2. Score and filter jobs
-        logging.info("Scoring jobs...")
-        scored_jobs = score_jobs_batch(all_jobs)
-        logging.info(f"Found {len(scored_jobs)} good matches")
+    elif args.replay is not None:
+        run_replay(args, parser)
         
-        # 3. Generate summary
-        summary_file = Path('summaries') / f'{today}.md'
-        summary_content = generate_summary(scored_jobs, today)
-        summary_file.write_text(summary_content)
+    elif args.profile:
+        logging.info(f"Profiling daily summary workflow against {args.profile} pages")
+        run_profile(args)
         
-        logging.info(f"Summary written to {summary_file}")
-        print(f"📊 Daily summary generated at {summary_file}")
-        print(f"✅ Found {len(scored_jobs)} matching jobs!")
+    elif args.daily_summary:
+        from scrapers.session import configure_cache
+        # Reuse unchanged pages from previous runs
+        configure_cache(str(Path('data') / 'http_cache'), offline=args.offline)
+        run_daily_summary(args)
         
     elif args.scrape_only:
         logging.info("Scraping mode")
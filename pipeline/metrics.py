@@ -0,0 +1,208 @@
+"""
+Run Metrics
+Timers and counters for sources, HTTP requests and pipeline stages
+"""
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+import json
+import os
+import re
+import threading
+import time
+
+
+# Prefix of every metric name in the Prometheus textfile
+PROMETHEUS_PREFIX = 'job_agent_'
+
+# Source the current thread or task is scraping for; HTTP metrics pick it up
+# as a label. asyncio tasks and to_thread() calls inherit it.
+current_source: ContextVar[Optional[str]] = ContextVar('current_source', default=None)
+
+_metrics = None
+_NULL_TIMER = nullcontext()
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class RunMetrics:
+    """
+    Thread-safe counters and timers for one run
+
+    Every value is keyed by a metric name plus a set of string labels
+    (source, host, stage, ...). Timers keep a count, total and maximum.
+    """
+
+    def __init__(self):
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._timers: Dict[Tuple[str, LabelKey], list] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                self._timers[key] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def report(self) -> Dict:
+        """
+        Everything recorded so far as a JSON-serializable dictionary
+
+        Besides the raw counters and timers, the report rolls up every value
+        carrying a `source` label per source, so the cost of each job board
+        can be read at a glance.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {key: list(value) for key, value in self._timers.items()}
+
+        report = {
+            'started': self.started.isoformat(timespec='seconds'),
+            'duration_seconds': round(time.perf_counter() - self._start, 3),
+            'sources': {},
+            'counters': {},
+            'timers': {},
+        }
+
+        for (name, labels), value in sorted(counters.items()):
+            report['counters'].setdefault(name, []).append({'labels': dict(labels), 'value': value})
+            source = dict(labels).get('source')
+            if source:
+                totals = report['sources'].setdefault(source, {})
+                totals[name] = totals.get(name, 0) + value
+
+        for (name, labels), (n, total, longest) in sorted(timers.items()):
+            report['timers'].setdefault(name, []).append({
+                'labels': dict(labels),
+                'count': n,
+                'total': round(total, 6),
+                'max': round(longest, 6),
+            })
+            source = dict(labels).get('source')
+            if source:
+                totals = report['sources'].setdefault(source, {})
+                totals[name] = round(totals.get(name, 0) + total, 6)
+
+        return report
+
+    def write_json(self, path: Path) -> Path:
+        """Write the run report as JSON"""
+        _write_atomic(Path(path), json.dumps(self.report(), indent=2))
+        return Path(path)
+
+    def write_prometheus(self, path: Path) -> Path:
+        """
+        Write the metrics in the Prometheus text exposition format
+
+        The file is replaced atomically, so it can be picked up by the node
+        exporter's textfile collector at any time.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {key: list(value) for key, value in self._timers.items()}
+
+        lines = []
+        declared = set()
+        for (name, labels), value in sorted(counters.items()):
+            metric = f'{PROMETHEUS_PREFIX}{_metric_name(name)}'
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric}{_prometheus_labels(labels)} {value}')
+
+        for (name, labels), (n, total, _) in sorted(timers.items()):
+            metric = f'{PROMETHEUS_PREFIX}{_metric_name(name)}'
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f'# TYPE {metric} summary')
+            lines.append(f'{metric}_sum{_prometheus_labels(labels)} {total:.6f}')
+            lines.append(f'{metric}_count{_prometheus_labels(labels)} {n}')
+
+        metric = f'{PROMETHEUS_PREFIX}run_duration_seconds'
+        lines.append(f'# TYPE {metric} gauge')
+        lines.append(f'{metric} {time.perf_counter() - self._start:.3f}')
+
+        _write_atomic(Path(path), '\n'.join(lines) + '\n')
+        return Path(path)
+
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def _prometheus_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in labels)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + '}'
+
+
+def _write_atomic(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def enable_metrics() -> RunMetrics:
+    """Start recording metrics for this process, replacing any earlier run"""
+    global _metrics
+    _metrics = RunMetrics()
+    return _metrics
+
+
+def disable_metrics():
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[RunMetrics]:
+    """The active RunMetrics, or None when metrics are disabled"""
+    return _metrics
+
+
+# Module-level shortcuts; each is a single None check when metrics are off
+
+def count(name: str, value: float = 1, **labels):
+    if _metrics is not None:
+        _metrics.count(name, value, **labels)
+
+
+def observe(name: str, seconds: float, **labels):
+    if _metrics is not None:
+        _metrics.observe(name, seconds, **labels)
+
+
+def timer(name: str, **labels):
+    """Context manager timing its body into `name`; free when metrics are off"""
+    if _metrics is None:
+        return _NULL_TIMER
+    return _metrics.timer(name, **labels)
@@ -0,0 +1,222 @@
+"""
+Run Profiler
+Sampling profiler that splits a run's hot spots into fetch, parse, score and render
+"""
+
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from scrapers.ratelimit import configure_rate_limits
+from scrapers.session import get_session
+
+
+PHASES = ('fetch', 'parse', 'score', 'render', 'other')
+
+# Frames that put a sample into a phase: (file suffix, function name or None
+# for any function in the file, phase). The innermost matching frame wins,
+# so e.g. the parsing done inside fetch_descriptions() counts as parse.
+PHASE_MARKERS = [
+    ('scrapers/session.py', 'fetch', 'fetch'),
+    ('scrapers/engine.py', 'parse_cards', 'parse'),
+    ('scrapers/details.py', 'extract_description', 'parse'),
+    ('analyzers/scorer.py', None, 'score'),
+    ('analyzers/vectorized.py', None, 'score'),
+    ('analyzers/matcher.py', None, 'score'),
+    ('main.py', 'generate_summary', 'render'),
+    ('pipeline/render.py', None, 'render'),
+]
+
+# Seconds between samples
+DEFAULT_INTERVAL = 0.005
+
+# Functions listed per phase in the report
+TOP_FUNCTIONS = 15
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread at a fixed interval
+
+    Unlike cProfile, this sees the scraper worker threads and the fetch
+    threads behind fetch_many(), and adds almost no overhead to the code
+    being measured. Each sample is assigned to the phase of its innermost
+    marker frame (see PHASE_MARKERS). Samples outside every phase are only
+    kept for the main thread, so idle workers don't drown out the report.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.elapsed = 0.0
+        self.phase_samples = Counter()
+        self._self = {phase: Counter() for phase in PHASES}
+        self._cumulative = {phase: Counter() for phase in PHASES}
+        self._phases: Dict[object, Optional[str]] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = 0.0
+
+    def start(self):
+        self._stop.clear()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed += time.perf_counter() - self._start
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._sample(frame, ident == main)
+
+    def _phase_of(self, code) -> Optional[str]:
+        if code not in self._phases:
+            filename = code.co_filename.replace('\\', '/')
+            self._phases[code] = next(
+                (phase for suffix, name, phase in PHASE_MARKERS
+                 if filename.endswith(suffix) and name in (None, code.co_name)),
+                None
+            )
+        return self._phases[code]
+
+    def _sample(self, frame, is_main: bool):
+        stack = []
+        phase = None
+        while frame is not None and phase is None:
+            stack.append(frame.f_code)
+            phase = self._phase_of(frame.f_code)
+            frame = frame.f_back
+
+        if phase is None:
+            if not is_main:
+                return
+            phase = 'other'
+
+        self.phase_samples[phase] += 1
+        self._self[phase][_describe(stack[0])] += 1
+        for function in {_describe(code) for code in stack}:
+            self._cumulative[phase][function] += 1
+
+    def report(self, top: int = TOP_FUNCTIONS) -> str:
+        """
+        Hot spots per phase as plain text
+
+        `self` counts samples where the function itself was running,
+        `cum` samples where it was anywhere on the stack within the phase.
+        """
+        total = sum(self.phase_samples.values())
+        lines = [
+            f"Sampled every {self.interval * 1000:.0f} ms for {self.elapsed:.2f}s: {total} samples",
+            '',
+            f"{'phase':<10}{'samples':>9}{'share':>8}",
+        ]
+        for phase in PHASES:
+            samples = self.phase_samples[phase]
+            share = samples / total if total else 0.0
+            lines.append(f"{phase:<10}{samples:>9}{share:>8.1%}")
+
+        for phase in PHASES:
+            if not self.phase_samples[phase]:
+                continue
+            lines += ['', f"== {phase} ==", f"{'self':>7}{'cum':>7}  function"]
+            for function, samples in self._self[phase].most_common(top):
+                lines.append(f"{samples:>7}{self._cumulative[phase][function]:>7}  {function}")
+            callers = [(f, n) for f, n in self._cumulative[phase].most_common(top)
+                       if not self._self[phase][f]]
+            for function, samples in callers:
+                lines.append(f"{'':>7}{samples:>7}  {function}")
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report())
+        return path
+
+
+def _describe(code) -> str:
+    parts = code.co_filename.replace('\\', '/').split('/')
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{'/'.join(parts[-2:])}:{code.co_firstlineno}({name})"
+
+
+class FixtureAdapter(BaseAdapter):
+    """Answers every request from an in-memory page for its host"""
+
+    def __init__(self, pages: Dict[str, bytes]):
+        """
+        Args:
+            pages: Host -> raw HTML returned for any path on that host
+        """
+        super().__init__()
+        self.pages = pages
+
+    def send(self, request, **kwargs) -> requests.Response:
+        body = self.pages.get(urlparse(request.url).netloc.lower())
+        response = requests.Response()
+        response.status_code = 200 if body is not None else 404
+        response._content = body if body is not None else b''
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'text/html; charset=utf-8'})
+        return response
+
+    def close(self):
+        pass
+
+
+def fixture_pages_by_host() -> Dict[str, bytes]:
+    """Every source's benchmark fixture page, keyed by the host it stands in for"""
+    from benchmarks.bench_parse import SPECS
+    from benchmarks.fixtures import load_fixtures
+    from scrapers.four_hour_workweek import URLS
+
+    fixtures = load_fixtures()
+    pages = {}
+    for source, spec in SPECS.items():
+        # The 4HWW spec takes whole URLs as its queries
+        urls = URLS if spec.url == '{query}' else [spec.page_url('', 0)]
+        for url in urls:
+            pages[urlparse(url).netloc.lower()] = fixtures[source]
+    return pages
+
+
+def use_fixture_pages(pages: Dict[str, bytes]):
+    """
+    Serve the shared session's requests from fixture pages
+
+    Politeness delays are switched off as well, since no request reaches a
+    job board.
+    """
+    adapter = FixtureAdapter(pages)
+    session = get_session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    configure_rate_limits(False)
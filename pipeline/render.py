@@ -0,0 +1,306 @@
+"""
+Summary Renderer
+Streams the summary of a run to Markdown, HTML and JSON Feed in one pass
+"""
+
+from contextlib import ExitStack
+from html import escape
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+import json
+
+from pipeline.stages import RunStats
+
+
+# Boards listed at the end of every summary
+SOURCE_LABELS = [
+    'LinkedIn',
+    'Indeed',
+    'Wellfound (AngelList)',
+    'Y Combinator Work at a Startup',
+    '4-Hour Workweek Job Board',
+    '80,000 Hours',
+    'Remote OK',
+]
+
+# Sub-scores explained under each job, with their labels
+MATCH_LABELS = [
+    ('remote_score', 'Remote Match'),
+    ('industry_score', 'Industry Match'),
+    ('role_score', 'Role Match'),
+    ('skills_score', 'Skills Match'),
+]
+
+
+def job_sources(job: Dict) -> str:
+    return ', '.join(job.get('sources') or [job['source']])
+
+
+def bucket_label(bucket: int, buckets: int) -> str:
+    """Score range of a histogram bucket, e.g. '0.7-0.8'"""
+    return f"{bucket / buckets:.1f}-{(bucket + 1) / buckets:.1f}"
+
+
+class MarkdownWriter:
+    """The daily summary committed to summaries/"""
+
+    extension = 'md'
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._empty = False
+
+    def begin(self, label: str, stats: RunStats, period: str):
+        self.out.write(f"# Job Search Summary - {label}\n\n## 🎯 Overview\n\n"
+                       f"Found **{stats.matched}** matching jobs {period}!\n\n")
+
+    def empty(self, period: str):
+        # An empty summary stops after the notice
+        self._empty = True
+        self.out.write(f"No jobs found matching your criteria {period}. The search continues tomorrow!\n\n"
+                       "### Next Steps\n- Scrapers will run again tomorrow\n"
+                       "- Check back for new opportunities\n")
+
+    def top_header(self):
+        self.out.write("## 🌟 Top Opportunities\n\n")
+
+    def job(self, rank: int, result: Dict):
+        job = result['job']
+        scores = result['scores']
+        reasons = ''.join(f"- {label}: {scores[key]:.0%}\n" for key, label in MATCH_LABELS)
+        self.out.write(
+            f"### {rank}. {job['title']} at {job['company']}\n\n"
+            f"**Score:** {result['total_score']}/1.0  \n"
+            f"**Location:** {job['location']}  \n"
+            f"**Source:** {job_sources(job)}  \n"
+            f"**URL:** {job['url']}\n\n"
+            f"**Why it's a match:**\n{reasons}\n---\n\n"
+        )
+
+    def breakdown(self, stats):
+        sources = ''.join(
+            f"| {source} | {counts['scraped']} | {counts['matched']} |\n"
+            for source, counts in sorted(stats.sources.items())
+        )
+        peak = max(stats.histogram) or 1
+        buckets = ''.join(
+            f"| {bucket_label(i, len(stats.histogram))} | {jobs} | {'█' * round(20 * jobs / peak)} |\n"
+            for i, jobs in reversed(list(enumerate(stats.histogram)))
+        )
+        self.out.write(
+            f"## 📈 By Source\n\nDays covered: {stats.days}\n\n"
+            f"| Source | Scraped | Matched |\n|---|---:|---:|\n{sources}\n"
+            f"## 📉 Score Distribution\n\n| Score | Jobs | |\n|---|---:|---|\n{buckets}\n"
+        )
+
+    def end(self, stats: RunStats):
+        if self._empty:
+            return
+        sources = ''.join(f"- {source}\n" for source in SOURCE_LABELS)
+        self.out.write(
+            "## 📊 Statistics\n\n"
+            f"- Total jobs scraped: {stats.scraped}\n"
+            f"- Jobs meeting criteria: {stats.matched}\n"
+            f"- Average score: {stats.average_score:.2f}\n"
+            f"- Top score: {stats.top_score:.2f}\n\n"
+            f"## 🛠️ Sources\n\n{sources}\n---\n*Generated automatically by Job Search Agent*\n"
+        )
+
+
+class HtmlWriter:
+    """A standalone HTML page with the same content as the Markdown summary"""
+
+    extension = 'html'
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._listing = False
+
+    def begin(self, label: str, stats: RunStats, period: str):
+        title = escape(f"Job Search Summary - {label}")
+        self.out.write(
+            f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{title}</title>\n</head>\n<body>\n<h1>{title}</h1>\n'
+            f'<p>Found <strong>{stats.matched}</strong> matching jobs {escape(period)}!</p>\n'
+        )
+
+    def empty(self, period: str):
+        self.out.write(f"<p>No jobs found matching your criteria {escape(period)}.</p>\n")
+
+    def top_header(self):
+        self._listing = True
+        self.out.write("<h2>Top Opportunities</h2>\n<ol>\n")
+
+    def _close_listing(self):
+        if self._listing:
+            self._listing = False
+            self.out.write("</ol>\n")
+
+    def job(self, rank: int, result: Dict):
+        job = result['job']
+        scores = result['scores']
+        reasons = ''.join(f"<li>{label}: {scores[key]:.0%}</li>" for key, label in MATCH_LABELS)
+        self.out.write(
+            f'<li><h3><a href="{escape(job["url"])}">{escape(job["title"])}</a> '
+            f'at {escape(job["company"])}</h3>\n'
+            f'<p>Score {result["total_score"]}/1.0 · {escape(job["location"])} · '
+            f'{escape(job_sources(job))}</p>\n<ul>{reasons}</ul></li>\n'
+        )
+
+    def breakdown(self, stats):
+        self._close_listing()
+        sources = ''.join(
+            f"<tr><td>{escape(source)}</td><td>{counts['scraped']}</td><td>{counts['matched']}</td></tr>\n"
+            for source, counts in sorted(stats.sources.items())
+        )
+        buckets = ''.join(
+            f"<tr><td>{bucket_label(i, len(stats.histogram))}</td><td>{jobs}</td></tr>\n"
+            for i, jobs in reversed(list(enumerate(stats.histogram)))
+        )
+        self.out.write(
+            f"<h2>By Source</h2>\n<p>Days covered: {stats.days}</p>\n<table>\n"
+            f"<tr><th>Source</th><th>Scraped</th><th>Matched</th></tr>\n{sources}</table>\n"
+            f"<h2>Score Distribution</h2>\n<table>\n<tr><th>Score</th><th>Jobs</th></tr>\n{buckets}</table>\n"
+        )
+
+    def end(self, stats: RunStats):
+        self._close_listing()
+        self.out.write(
+            "<h2>Statistics</h2>\n<ul>\n"
+            f"<li>Total jobs scraped: {stats.scraped}</li>\n"
+            f"<li>Jobs meeting criteria: {stats.matched}</li>\n"
+            f"<li>Average score: {stats.average_score:.2f}</li>\n"
+            f"<li>Top score: {stats.top_score:.2f}</li>\n</ul>\n</body>\n</html>\n"
+        )
+
+
+class JsonFeedWriter:
+    """A JSON Feed 1.1 document, so a feed reader can follow the summaries"""
+
+    extension = 'json'
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._items = 0
+        self._breakdown = None
+
+    def begin(self, label: str, stats: RunStats, period: str):
+        header = {
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': f"Job Search Summary - {label}",
+            'description': f"{stats.matched} matching jobs {period}, "
+                           f"average score {stats.average_score:.2f}",
+        }
+        # Items are streamed into the array one at a time
+        self.out.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "items": [')
+
+    def empty(self, period: str):
+        pass
+
+    def top_header(self):
+        pass
+
+    def job(self, rank: int, result: Dict):
+        job = result['job']
+        item = {
+            'id': job['url'],
+            'url': job['url'],
+            'title': f"{job['title']} at {job['company']}",
+            'content_text': f"Score {result['total_score']}/1.0 · {job['location']} · {job_sources(job)}",
+            'tags': [job['location']] + (job.get('sources') or [job['source']]),
+            '_job_search': {'rank': rank, 'total_score': result['total_score'], 'scores': result['scores']},
+        }
+        self.out.write((',' if self._items else '') + '\n  ' + json.dumps(item, ensure_ascii=False))
+        self._items += 1
+
+    def breakdown(self, stats):
+        # Written after the items, where the feed object is still open
+        self._breakdown = {
+            'days': stats.days,
+            'sources': stats.sources,
+            'score_histogram': {bucket_label(i, len(stats.histogram)): jobs
+                                for i, jobs in enumerate(stats.histogram)},
+        }
+
+    def end(self, stats: RunStats):
+        extension = '' if self._breakdown is None else \
+            ', "_job_search": ' + json.dumps(self._breakdown, ensure_ascii=False)
+        self.out.write(f'\n]{extension}}}\n')
+
+
+WRITERS = {writer.extension: writer for writer in (MarkdownWriter, HtmlWriter, JsonFeedWriter)}
+
+
+def render(results: Iterable[Dict], label: str, stats: RunStats, outputs: Sequence,
+           limit: Optional[int] = None, period: str = 'today', breakdown: bool = False):
+    """
+    Stream a summary to any number of writers in a single pass
+
+    Each result is formatted once per writer and written straight out, so
+    memory stays flat however many jobs are listed.
+
+    Args:
+        results: Scored jobs, best first
+        label: Heading label, e.g. the date
+        stats: Counts and score aggregates for everything the summary covers
+        outputs: Writer instances (see WRITERS)
+        limit: List at most this many results
+        period: How the summary's time span is described, e.g. 'this week'
+        breakdown: Add per-source counts and the score distribution; `stats`
+            must then be a Rollup (see pipeline.rollups)
+    """
+    for writer in outputs:
+        writer.begin(label, stats, period)
+
+    listed = 0
+    for result in results:
+        if limit is not None and listed >= limit:
+            break
+        if not listed:
+            for writer in outputs:
+                writer.top_header()
+        listed += 1
+        for writer in outputs:
+            writer.job(listed, result)
+
+    if not listed:
+        for writer in outputs:
+            writer.empty(period)
+
+    if breakdown:
+        for writer in outputs:
+            writer.breakdown(stats)
+
+    for writer in outputs:
+        writer.end(stats)
+
+
+def write_summary(results: Iterable[Dict], label: str, stats: RunStats, path: Path,
+                  formats: Sequence[str] = ('md',), limit: Optional[int] = None,
+                  period: str = 'today', breakdown: bool = False) -> List[Path]:
+    """
+    Render a summary into one file per format
+
+    Args:
+        results: Scored jobs, best first
+        label: Heading label, e.g. the date
+        stats: Counts and score aggregates for everything the summary covers
+        path: Output path without extension, e.g. summaries/2026-01-31
+        formats: Extensions from WRITERS
+        limit: List at most this many results
+        period: How the summary's time span is described
+        breakdown: Add per-source counts and the score distribution
+
+    Returns:
+        Paths written, in the order of `formats`
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    paths = [path.with_name(f'{path.name}.{extension}') for extension in formats]
+    with ExitStack() as stack:
+        outputs = [
+            WRITERS[extension](stack.enter_context(open(target, 'w', encoding='utf-8')))
+            for extension, target in zip(formats, paths)
+        ]
+        render(results, label, stats, outputs, limit, period, breakdown)
+    return paths
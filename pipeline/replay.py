@@ -0,0 +1,116 @@
+"""
+Archive Replay
+Re-scores archived days with the current configuration, without scraping
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import logging
+
+from analyzers.dedup import Deduplicator
+from analyzers.parallel import ScoringPool
+from analyzers.scorer import JobScorer, score_jobs_batch
+from pipeline.render import write_summary
+from pipeline.stages import RunStats, TopN, chunked, dedupe_stream
+from storage.archive import JobArchive
+
+
+logger = logging.getLogger(__name__)
+
+# Jobs scored at a time; large enough for the NumPy path to kick in
+REPLAY_CHUNK_SIZE = 5000
+
+# Scorer of the current worker process, built once by init_worker()
+_scorer: Optional[JobScorer] = None
+
+
+def init_worker(config_path: str = 'config.json'):
+    """Load the scoring configuration once per worker process"""
+    global _scorer
+    _scorer = JobScorer(config_path)
+
+
+def replay_day(date: str, archive_dir: str, output_dir: str,
+               formats: Sequence[str] = ('md',), top: int = 10,
+               pool: Optional[ScoringPool] = None) -> Dict:
+    """
+    Deduplicate, score and summarize one archived day
+
+    Args:
+        date: Day to replay (YYYY-MM-DD)
+        archive_dir: JobArchive folder
+        output_dir: Folder the day's summary is written to
+        formats: Summary formats to write (see pipeline.render.WRITERS)
+        top: Number of jobs listed in the summary
+        pool: Spreads the day's scoring across processes
+
+    Returns:
+        The day's counts and the path of its summary
+    """
+    if _scorer is None:
+        init_worker()
+
+    stats = RunStats()
+    dedup = Deduplicator()
+    top_jobs = TopN(top)
+
+    jobs = stats.count_scraped(JobArchive(archive_dir).iter_jobs(date, date))
+    for chunk in chunked(dedupe_stream(jobs, dedup), REPLAY_CHUNK_SIZE):
+        for result in score_jobs_batch(chunk, scorer=_scorer, pool=pool):
+            stats.add_match(result)
+            top_jobs.push(result)
+
+    summary_file = write_summary(top_jobs.results(), date, stats, Path(output_dir) / date, formats)[0]
+
+    return {
+        'date': date,
+        'scraped': stats.scraped,
+        'unique': stats.scraped - dedup.duplicates,
+        'matched': stats.matched,
+        'top_score': stats.top_score,
+        'summary': str(summary_file),
+    }
+
+
+def replay_archive(dates: List[str], formats: Sequence[str] = ('md',), top: int = 10,
+                   archive_dir: str = 'data/archive', output_dir: str = 'summaries/replay',
+                   config_path: str = 'config.json', processes: Optional[int] = None) -> List[Dict]:
+    """
+    Replay archived days in parallel, one day file per task
+
+    A single day is replayed in this process with its scoring spread
+    across a ScoringPool instead.
+
+    Nothing is fetched, and the seen-jobs database is neither read nor
+    updated, so every archived job of a day is scored again.
+
+    Args:
+        dates: Days to replay (YYYY-MM-DD)
+        formats: Summary formats to write (see pipeline.render.WRITERS)
+        top: Number of jobs listed in each summary
+        archive_dir: JobArchive folder
+        output_dir: Folder for the regenerated summaries
+        config_path: Scoring configuration to apply
+        processes: Worker processes; defaults to the CPU count, and 1 replays
+            in this process
+
+    Returns:
+        One result per day from replay_day(), in the order of `dates`
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    if processes == 1 or not dates:
+        init_worker(config_path)
+        return [replay_day(date, archive_dir, output_dir, formats, top) for date in dates]
+
+    if len(dates) == 1:
+        # A single file can't be shared out, so its scoring is instead
+        init_worker(config_path)
+        with ScoringPool(config_path, processes) as pool:
+            return [replay_day(dates[0], archive_dir, output_dir, formats, top, pool)]
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_worker,
+                             initargs=(config_path,)) as pool:
+        futures = [pool.submit(replay_day, date, archive_dir, output_dir, formats, top) for date in dates]
+        return [future.result() for future in futures]
@@ -0,0 +1,245 @@
+"""
+Rollup Digests
+Weekly and monthly digests merged from small per-day aggregates
+"""
+
+from datetime import date as Date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import calendar
+import json
+import logging
+import os
+import re
+
+from pipeline.render import write_summary
+from pipeline.stages import RunStats, TopN
+
+
+logger = logging.getLogger(__name__)
+
+# Score histogram buckets of width 0.1
+HISTOGRAM_BUCKETS = 10
+
+# Best results kept per aggregate, enough to fill a digest after duplicates
+# across days are dropped
+ROLLUP_TOP = 25
+
+# Job fields kept with each result, all a digest shows
+RESULT_FIELDS = ('title', 'company', 'location', 'source', 'sources', 'url')
+
+_DAY_FILE = re.compile(r'^(\d{4}-\d{2}-\d{2})\.json$')
+_WEEK = re.compile(r'^(\d{4})-W(\d{2})$')
+_MONTH = re.compile(r'^(\d{4})-(\d{2})$')
+
+
+class Rollup(RunStats):
+    """
+    RunStats plus what a digest needs: per-source counts, a score histogram
+    and the best results
+
+    Everything in it merges by addition (and the top results by keeping the
+    best), so a month is the sum of its days without reading any jobs again.
+    """
+
+    def __init__(self, top: int = ROLLUP_TOP):
+        super().__init__()
+        self.days = 0
+        self.sources: Dict[str, Dict[str, int]] = {}
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+        self.top = TopN(top)
+
+    def _source(self, name: Optional[str]) -> Dict[str, int]:
+        return self.sources.setdefault(name or 'unknown', {'scraped': 0, 'matched': 0})
+
+    def count_scraped(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Pass jobs through, counting them per source"""
+        for job in jobs:
+            self.scraped += 1
+            self._source(job.get('source'))['scraped'] += 1
+            yield job
+
+    def add_match(self, result: Dict):
+        super().add_match(result)
+        self._source(result['job'].get('source'))['matched'] += 1
+        bucket = min(int(result['total_score'] * HISTOGRAM_BUCKETS), HISTOGRAM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+        self.top.push(result)
+
+    def merge(self, other: 'Rollup'):
+        """Add another aggregate's counts and results to this one"""
+        self.days += other.days
+        self.scraped += other.scraped
+        self.matched += other.matched
+        self.score_total += other.score_total
+        self.top_score = max(self.top_score, other.top_score)
+        for name, counts in other.sources.items():
+            mine = self._source(name)
+            mine['scraped'] += counts['scraped']
+            mine['matched'] += counts['matched']
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        for result in other.top.results():
+            self.top.push(result)
+
+    def results(self) -> List[Dict]:
+        """Best results, once per posting URL"""
+        listed = set()
+        results = []
+        for result in self.top.results():
+            url = result['job'].get('url')
+            if url not in listed:
+                listed.add(url)
+                results.append(result)
+        return results
+
+    def to_dict(self) -> Dict:
+        return {
+            'scraped': self.scraped,
+            'matched': self.matched,
+            'score_total': self.score_total,
+            'top_score': self.top_score,
+            'sources': self.sources,
+            'histogram': self.histogram,
+            'top': [
+                {
+                    'job': {field: result['job'][field] for field in RESULT_FIELDS
+                            if result['job'].get(field) is not None},
+                    'total_score': result['total_score'],
+                    'scores': result['scores'],
+                }
+                for result in self.top.results()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Rollup':
+        rollup = cls(max(ROLLUP_TOP, len(data['top'])))
+        rollup.days = 1
+        rollup.scraped = data['scraped']
+        rollup.matched = data['matched']
+        rollup.score_total = data['score_total']
+        rollup.top_score = data['top_score']
+        rollup.sources = data['sources']
+        rollup.histogram = data['histogram']
+        for result in data['top']:
+            rollup.top.push(result)
+        return rollup
+
+
+class RollupStore:
+    """
+    One small JSON aggregate per day, written at the end of each daily run
+
+    A later run on the same day replaces that day's aggregate: checkpoint
+    replay and the same-day seen-jobs rule make every run cover the whole
+    day so far, so adding runs up would count the day twice.
+    """
+
+    def __init__(self, directory: str = 'data/rollups'):
+        """
+        Args:
+            directory: Folder holding one aggregate per day
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, date: str) -> Path:
+        return self.directory / f'{date}.json'
+
+    def dates(self, start: Optional[str] = None, end: Optional[str] = None) -> List[str]:
+        """Days with an aggregate, oldest first, optionally within [start, end]"""
+        found = []
+        for path in self.directory.iterdir():
+            match = _DAY_FILE.match(path.name)
+            if match and (start is None or match.group(1) >= start) and (end is None or match.group(1) <= end):
+                found.append(match.group(1))
+        return sorted(found)
+
+    def load(self, date: str) -> Optional[Rollup]:
+        path = self.path_for(date)
+        if not path.exists():
+            return None
+        with open(path, encoding='utf-8') as f:
+            return Rollup.from_dict(json.load(f))
+
+    def record(self, date: str, rollup: Rollup) -> Path:
+        """
+        Save a run's aggregate as its day's, replacing any earlier run's
+
+        Args:
+            date: Day of the run (YYYY-MM-DD)
+            rollup: The run's aggregate
+
+        Returns:
+            Path of the day's aggregate
+        """
+        path = self.path_for(date)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(rollup.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, path)
+        return path
+
+    def merged(self, start: str, end: str, top: int = ROLLUP_TOP) -> Rollup:
+        """Aggregate of every recorded day from start to end, inclusive, keeping `top` results"""
+        rollup = Rollup(top)
+        for date in self.dates(start, end):
+            rollup.merge(self.load(date))
+        return rollup
+
+
+def period_of(date: str, kind: str) -> str:
+    """
+    Digest period a day belongs to
+
+    Args:
+        date: Day (YYYY-MM-DD)
+        kind: 'week' (ISO week, e.g. 2026-W42) or 'month' (e.g. 2026-10)
+    """
+    if kind == 'month':
+        return date[:7]
+    year, week, _ = Date.fromisoformat(date).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def period_bounds(period: str) -> Tuple[str, str]:
+    """
+    First and last day of a digest period
+
+    Raises:
+        ValueError: If the period is neither YYYY-Www nor YYYY-MM
+    """
+    week = _WEEK.match(period)
+    if week:
+        first = Date.fromisocalendar(int(week.group(1)), int(week.group(2)), 1)
+        return first.isoformat(), (first + timedelta(days=6)).isoformat()
+    month = _MONTH.match(period)
+    if month:
+        year, number = int(month.group(1)), int(month.group(2))
+        last = calendar.monthrange(year, number)[1]
+        return Date(year, number, 1).isoformat(), Date(year, number, last).isoformat()
+    raise ValueError(f"Unknown digest period {period!r}; use YYYY-Www or YYYY-MM")
+
+
+def write_digest(store: RollupStore, period: str, summaries_dir: Path = Path('summaries'),
+                 formats: Sequence[str] = ('md',), top: int = 10) -> List[Path]:
+    """
+    Merge a period's day aggregates into a digest
+
+    Args:
+        store: Day aggregates
+        period: ISO week (YYYY-Www) or month (YYYY-MM)
+        summaries_dir: Digests go to its weekly/ or monthly/ folder
+        formats: Digest formats to write (see pipeline.render.WRITERS)
+        top: Number of jobs listed
+
+    Returns:
+        Paths written, Markdown first
+    """
+    start, end = period_bounds(period)
+    rollup = store.merged(start, end, max(top, ROLLUP_TOP))
+    folder = 'weekly' if _WEEK.match(period) else 'monthly'
+    paths = write_summary(rollup.results(), period, rollup, Path(summaries_dir) / folder / period,
+                          formats, limit=top, period=f'from {start} to {end}', breakdown=True)
+    logger.info(f"Digest for {period} merged from {rollup.days} days into {paths[0]}")
+    return paths
@@ -0,0 +1,113 @@
+"""
+Pipeline Stages
+Streaming building blocks that carry jobs from the scrapers to the summary
+"""
+
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional
+import heapq
+import logging
+
+from analyzers.dedup import Deduplicator
+
+
+logger = logging.getLogger(__name__)
+
+
+def dedupe_stream(jobs: Iterable[Dict], dedup: Optional[Deduplicator] = None) -> Iterator[Dict]:
+    """
+    Drop duplicate postings as they arrive
+
+    A duplicate seen later is still merged into the original it matches, so
+    the original's `sources` (and a missing description) may be filled in
+    after it has moved on down the pipeline.
+
+    Args:
+        jobs: Job dictionaries
+        dedup: Index to use, e.g. to inspect its counters afterwards
+
+    Yields:
+        First occurrence of each posting
+    """
+    dedup = dedup or Deduplicator()
+    unique = 0
+    for job in jobs:
+        if dedup.add(job) is not None:
+            unique += 1
+            yield job
+    logger.info(f"Removed {dedup.duplicates} duplicate jobs, {unique} unique")
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Group a stream into lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class TopN:
+    """
+    The N highest-scoring results of a stream, kept in a bounded heap
+
+    Ties keep the job that comes first in source order (its `order` tag
+    from iter_scrapers), so the result doesn't depend on which scraper
+    thread delivered first; untagged results keep the earlier one pushed,
+    matching a stable sort by score.
+    """
+
+    def __init__(self, n: int = 10):
+        self.n = n
+        self._heap = []
+        self._order = count()
+
+    def push(self, result: Dict):
+        # Later results rank lower on ties, so they are evicted first
+        order = result['job'].get('order')
+        rank = (-order[0], -order[1]) if order else (0, 0)
+        entry = (result['total_score'], rank, -next(self._order), result)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> List[Dict]:
+        """Kept results, best first"""
+        return [entry[3] for entry in sorted(self._heap, key=lambda e: e[:3], reverse=True)]
+
+
+class RunStats:
+    """Counts and score aggregates for the summary, updated in one pass"""
+
+    def __init__(self):
+        self.scraped = 0
+        self.matched = 0
+        self.score_total = 0.0
+        self.top_score = 0.0
+
+    def count_scraped(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Pass jobs through, counting them"""
+        for job in jobs:
+            self.scraped += 1
+            yield job
+
+    def add_match(self, result: Dict):
+        self.matched += 1
+        self.score_total += result['total_score']
+        self.top_score = max(self.top_score, result['total_score'])
+
+    @property
+    def average_score(self) -> float:
+        return self.score_total / self.matched if self.matched else 0.0
+
+    @classmethod
+    def from_results(cls, results: List[Dict]) -> 'RunStats':
+        stats = cls()
+        stats.scraped = len(results)
+        for result in results:
+            stats.add_match(result)
+        return stats
@@ -0,0 +1,144 @@
+"""
+Job Detail Fetcher
+Fills in job descriptions from individual posting pages
+"""
+
+from typing import Dict, List
+from urllib.parse import urlparse
+import logging
+import re
+
+from analyzers.dedup import canonicalize_url
+from scrapers.async_fetch import fetch_many
+from scrapers.parsing import parse_html
+
+
+logger = logging.getLogger(__name__)
+
+# Where each board puts the posting body, tried in order
+DESCRIPTION_SELECTORS = {
+    'linkedin.com': ['div.show-more-less-html__markup', 'div.description__text'],
+    'indeed.com': ['#jobDescriptionText'],
+    'wellfound.com': ['div[class*="description"]'],
+    'remoteok.com': ['div.description', 'div.markdown'],
+    '80000hours.org': ['div.job-description', 'article'],
+    'workatastartup.com': ['div.prose', 'div[class*="description"]'],
+}
+FALLBACK_SELECTORS = ['[itemprop="description"]', 'article', 'main']
+
+MAX_DESCRIPTION_CHARS = 20000
+
+
+def extract_description(html: bytes, url: str) -> str:
+    """
+    Pull the posting text out of a job detail page
+
+    Args:
+        html: Raw page content
+        url: Page URL, used to pick the board's selectors
+
+    Returns:
+        Whitespace-normalized description, or '' if none was found
+    """
+    soup = parse_html(html)
+    host = urlparse(url).netloc.lower()
+
+    selectors = []
+    for domain, domain_selectors in DESCRIPTION_SELECTORS.items():
+        if host == domain or host.endswith(f'.{domain}'):
+            selectors = domain_selectors
+            break
+
+    for selector in selectors + FALLBACK_SELECTORS:
+        elem = soup.select_one(selector)
+        if elem:
+            text = elem.get_text(' ', strip=True)
+            if text:
+                return re.sub(r'\s+', ' ', text)[:MAX_DESCRIPTION_CHARS]
+
+    for name in ('description', 'og:description'):
+        meta = soup.find('meta', attrs={'name': name}) or soup.find('meta', attrs={'property': name})
+        if meta and meta.get('content'):
+            return meta['content'].strip()[:MAX_DESCRIPTION_CHARS]
+
+    return ''
+
+
+def fetch_descriptions(jobs: List[Dict], budget: int = 40, scorer=None, store=None,
+                       max_concurrency: int = 8) -> int:
+    """
+    Fetch missing descriptions for the most promising jobs
+
+    Jobs are ranked by their title-only score, so the fetch budget goes to
+    the postings most likely to make the summary. Pages are fetched
+    concurrently under the per-host rate limits. With a store, every URL is
+    fetched at most once in its lifetime and earlier results are reused.
+    Jobs whose URL is only the search page they were listed on are skipped.
+
+    Args:
+        jobs: Job dictionaries; descriptions are filled in place
+        budget: Maximum number of pages to fetch
+        scorer: Optional JobScorer used to rank jobs before fetching
+        store: Optional DescriptionStore caching descriptions by URL
+        max_concurrency: Maximum requests in flight across all hosts
+
+    Returns:
+        Number of pages fetched, so a caller can spread one budget over
+        several calls
+    """
+    missing = [
+        job for job in jobs
+        if not job.get('description') and (job.get('url') or '').startswith('http')
+        and not job.get('url_is_page')
+    ]
+    if not missing:
+        return 0
+
+    def key(job: Dict) -> str:
+        return job.get('canonical_url') or canonicalize_url(job['url'])
+
+    filled = 0
+    if store is not None:
+        known = store.get_many(key(job) for job in missing)
+        for job in missing:
+            if known.get(key(job)):
+                job['description'] = known[key(job)]
+                filled += 1
+        missing = [job for job in missing if key(job) not in known]
+
+    if scorer is not None:
+        # Descriptions are empty here, so this is the title-only score
+        missing.sort(key=lambda job: scorer.score_job(job)['total_score'], reverse=True)
+
+    selected = missing[:budget]
+    if not selected:
+        return 0
+
+    logger.info(f"Fetching {len(selected)} job detail pages ({len(missing) - len(selected)} over budget)")
+    responses = fetch_many([job['url'] for job in selected], max_concurrency=max_concurrency)
+
+    fetched = {}
+    for job, response in zip(selected, responses):
+        if isinstance(response, Exception):
+            logger.warning(f"Error fetching job details from {job['url']}: {response}")
+            # Gone or forbidden pages won't come back; transient errors are retried next run
+            status = getattr(getattr(response, 'response', None), 'status_code', None)
+            if status and 400 <= status < 500 and status != 429:
+                fetched[key(job)] = ''
+            continue
+        try:
+            description = extract_description(response.content, response.url or job['url'])
+        except Exception as e:
+            logger.warning(f"Error parsing job details from {job['url']}: {e}")
+            description = ''
+
+        fetched[key(job)] = description
+        if description:
+            job['description'] = description
+            filled += 1
+
+    if store is not None:
+        store.put_many(fetched)
+
+    logger.info(f"Filled {filled} job descriptions")
+    return len(selected)
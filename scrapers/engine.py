@@ -0,0 +1,402 @@
+"""
+Declarative Scraper Engine
+Runs job board scrapes described by selector specs
+"""
+
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin
+import hashlib
+import logging
+
+from bs4 import SoupStrainer, Tag
+import soupsieve
+
+from pipeline import metrics
+from scrapers.async_fetch import fetch_many
+from scrapers.parsing import parse_html
+from scrapers.session import fetch, get_cache
+from storage.checkpoints import CheckpointStore
+from storage.seen_jobs import SeenJobsStore
+
+
+logger = logging.getLogger(__name__)
+
+# Values used when a spec doesn't scrape a field or a card lacks it
+DEFAULT_FIELDS = {
+    'title': 'Unknown',
+    'company': 'Unknown',
+    'location': 'Remote',
+    'description': '',
+}
+
+# Optional checkpoint store for resumable runs; see configure_checkpoints()
+_checkpoints = None
+
+# Hash of the scraper code, so jobs parsed by an older version aren't reused
+_parser_version = None
+
+# Optional seen-jobs store and run date for stopping early; see configure_known_postings()
+_known = None
+_known_before = None
+
+
+class Field:
+    """
+    Where one job field lives inside a card
+
+    Selectors are tried in priority order: an element matching an earlier
+    selector wins over one matching a later selector, wherever it sits in
+    the card.
+    """
+
+    def __init__(self, *selectors: str, attr: Optional[str] = None, template: str = '{}'):
+        """
+        Args:
+            selectors: CSS selectors, highest priority first
+            attr: Attribute to read instead of the element's text
+            template: Format string applied to the value, e.g. to build a URL from an ID
+        """
+        self.selectors = selectors
+        self.compiled = [soupsieve.compile(selector) for selector in selectors]
+        self.attr = attr
+        self.template = template
+
+    def value(self, elem: Tag) -> str:
+        raw = elem.get(self.attr, '') if self.attr else elem.get_text(strip=True)
+        if isinstance(raw, list):
+            raw = ' '.join(raw)
+        return self.template.format(raw.strip()) if raw else ''
+
+
+class SourceSpec:
+    """
+    Everything the engine needs to scrape one job board
+
+    `url` and the `params` values may use {query}, {page} (from 0) and
+    {start} (the offset of the page's first card).
+    """
+
+    def __init__(self, source: str, url: str, cards: Iterable[str], fields: Dict[str, Field],
+                 strainer: Optional[SoupStrainer] = None, params: Optional[Dict[str, str]] = None,
+                 required: Tuple[str, ...] = ('title',), defaults: Optional[Dict[str, str]] = None,
+                 per_page: Optional[int] = None, pages: int = 1, max_results: Optional[int] = None,
+                 first_match_only: bool = False,
+                 card_filter: Optional[Callable[[Tag], bool]] = None,
+                 finalize: Optional[Callable[[Dict, Tag], None]] = None):
+        """
+        Args:
+            source: Value of each job's `source` field
+            url: Search page URL template
+            cards: CSS selectors for job cards; the first one that finds any wins
+            fields: Job field name -> Field; 'url' is resolved against the page URL
+            strainer: Restricts the parse tree to the cards
+            params: Query string template
+            required: Fields a card must have to become a job
+            defaults: Overrides for DEFAULT_FIELDS
+            per_page: Cards used per page (also the {start} step)
+            pages: Pages fetched per query at most
+            max_results: Jobs returned at most
+            first_match_only: Try queries one at a time and stop at the first with jobs
+            card_filter: Skip cards for which this returns False
+            finalize: Adjust a job in place using its card
+        """
+        self.source = source
+        self.url = url
+        self.cards = [soupsieve.compile(selector) for selector in cards]
+        self.fields = fields
+        self.strainer = strainer
+        self.params = params or {}
+        self.required = required
+        self.defaults = {**DEFAULT_FIELDS, **(defaults or {})}
+        self.per_page = per_page
+        self.pages = pages
+        self.max_results = max_results
+        self.first_match_only = first_match_only
+        self.card_filter = card_filter
+        self.finalize = finalize
+
+    def page_url(self, query: str, page: int) -> str:
+        values = {'query': query, 'page': page, 'start': page * (self.per_page or 0)}
+        url = self.url.format(**values)
+        if self.params:
+            params = {key: str(value).format(**values) for key, value in self.params.items()}
+            url = f"{url}?{urlencode(params)}"
+        return url
+
+
+def extract_fields(card: Tag, fields: Dict[str, Field]) -> Dict[str, Tag]:
+    """
+    Find the element for every field in one pass over the card
+
+    The card itself is included, so a field can read the card element
+    (e.g. a card that is the job link). The walk stops as soon as every
+    field has matched its first-choice selector.
+    """
+    found: Dict[str, Tuple[int, Tag]] = {}
+    remaining = len(fields)
+
+    for elem in chain((card,), card.descendants):
+        if not isinstance(elem, Tag):
+            continue
+        for name, field in fields.items():
+            best = found.get(name)
+            limit = best[0] if best else len(field.compiled)
+            for rank in range(limit):
+                if field.compiled[rank].match(elem):
+                    found[name] = (rank, elem)
+                    if rank == 0:
+                        remaining -= 1
+                    break
+        if not remaining:
+            break
+
+    return {name: elem for name, (_, elem) in found.items()}
+
+
+def parse_cards(spec: SourceSpec, content: bytes, page_url: str) -> List[Dict]:
+    """
+    Turn one search page into job dictionaries
+
+    Args:
+        spec: Source spec
+        content: Raw page content
+        page_url: URL the page came from, for relative links and as the
+            URL of cards without a link (which get `url_is_page` set)
+
+    Returns:
+        Jobs found on the page, in page order
+    """
+    soup = parse_html(content, spec.strainer)
+
+    cards = []
+    for selector in spec.cards:
+        cards = selector.select(soup)
+        if cards:
+            break
+    if spec.card_filter is not None:
+        cards = [card for card in cards if spec.card_filter(card)]
+
+    jobs = []
+    for card in cards[:spec.per_page]:
+        try:
+            elems = extract_fields(card, spec.fields)
+            values = {name: spec.fields[name].value(elem) for name, elem in elems.items()}
+            if not all(values.get(name) for name in spec.required):
+                continue
+
+            job = {
+                name: values.get(name) or default for name, default in spec.defaults.items()
+            }
+            if values.get('url'):
+                job['url'] = urljoin(page_url, values['url'])
+            else:
+                # No link of its own: point at the search page, and say so,
+                # so nobody fetches it as the posting
+                job['url'] = page_url
+                job['url_is_page'] = True
+            job['source'] = spec.source
+            if spec.finalize is not None:
+                spec.finalize(job, card)
+            jobs.append(job)
+        except Exception as e:
+            logger.warning(f"Error parsing {spec.source} job card: {e}")
+            continue
+
+    return jobs
+
+
+def parser_version() -> str:
+    """
+    Version of the code that turns pages into jobs
+
+    A hash of every module in this package, specs included: any change to
+    how pages are parsed makes jobs parsed earlier unusable.
+    """
+    global _parser_version
+
+    if _parser_version is None:
+        digest = hashlib.sha256()
+        for path in sorted(Path(__file__).parent.glob('*.py')):
+            digest.update(path.read_bytes())
+        _parser_version = digest.hexdigest()
+    return _parser_version
+
+
+def configure_checkpoints(store: Optional[CheckpointStore]):
+    """
+    Resume scrapes from, and record finished queries in, a checkpoint store
+
+    Args:
+        store: Today's CheckpointStore, or None to turn checkpointing off
+    """
+    global _checkpoints
+    _checkpoints = store
+
+
+def configure_known_postings(store: Optional[SeenJobsStore], today: Optional[str] = None):
+    """
+    Stop paging a query once a whole page holds postings from earlier runs
+
+    Boards list newest first, so a page of known postings means the rest
+    are known too.
+
+    Args:
+        store: The SeenJobsStore, or None to always page to the limit
+        today: Date of the run; postings first seen today don't count as known
+    """
+    global _known, _known_before
+    _known = store
+    _known_before = today
+
+
+def iter_scrape(spec: SourceSpec, queries: Iterable[str] = ('',),
+                max_results: Optional[int] = None, pages: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Scrape a job board described by a spec, yielding jobs page by page
+
+    Each round fetches the next page of every query still in play
+    concurrently (under the per-host rate limits and the HTTP cache; a page
+    the cache serves unchanged reuses the jobs parsed from it). A query
+    stops paging once a page adds no new jobs, or (see
+    configure_known_postings()) once every job on a page was seen on an
+    earlier run.
+
+    With checkpointing on (see configure_checkpoints()), each query is
+    recorded once it is finished, and queries finished by an earlier run
+    today are replayed from the checkpoint instead of fetched. A query whose
+    fetch failed is not recorded, so a re-run retries just that query.
+
+    Args:
+        spec: Source spec
+        queries: Search terms filled into the URL template
+        max_results: Overrides the spec's result limit
+        pages: Overrides the spec's page limit
+
+    Yields:
+        Job dictionaries, in page order and query order within a round
+    """
+    queries = list(queries)
+    limit = max_results if max_results is not None else spec.max_results
+    pages = pages if pages is not None else spec.pages
+    checkpoints = _checkpoints
+    known, known_before = _known, _known_before
+    cache = get_cache()
+    parser = f'{spec.source}:{parser_version()}' if cache is not None else None
+    seen = set()
+    count = 0
+
+    logger.info(f"Scraping {spec.source} for {queries}")
+
+    def unique(jobs: List[Dict]) -> List[Dict]:
+        fresh = []
+        for job in jobs:
+            key = (job['url'], job['title'])
+            if key not in seen:
+                seen.add(key)
+                fresh.append(job)
+        return fresh
+
+    def new_jobs(query: str, url: str, response) -> Optional[List[Dict]]:
+        if isinstance(response, Exception):
+            logger.error(f"Error scraping {spec.source} for '{query}': {response}")
+            return None
+        # A page served from the cache, or confirmed unchanged by a 304, has
+        # the body it had when its jobs were last parsed
+        if cache is not None and getattr(response, 'from_cache', False):
+            parsed = cache.load_parsed(url, parser, response.content)
+            if parsed is not None:
+                return unique(parsed)
+        with metrics.timer('parse_seconds', source=metrics.current_source.get() or spec.source):
+            parsed = parse_cards(spec, response.content, url)
+        if cache is not None:
+            cache.store_parsed(url, parser, response.content, parsed)
+        return unique(parsed)
+
+    def all_known(jobs: List[Dict]) -> bool:
+        return known is not None and all(known.is_known(job['url'], known_before) for job in jobs)
+
+    def full() -> bool:
+        return limit is not None and count >= limit
+
+    done = {}
+    if checkpoints is not None:
+        for query in queries:
+            jobs = checkpoints.completed(spec.source, query)
+            if jobs is not None:
+                done[query] = jobs
+        if done:
+            logger.info(f"Resuming {spec.source}: {len(done)} of {len(queries)} queries already done")
+
+    if spec.first_match_only:
+        for query in queries:
+            if query in done:
+                jobs = unique(done[query])
+            else:
+                url = spec.page_url(query, 0)
+                try:
+                    response = fetch(url)
+                except Exception as e:
+                    response = e
+                jobs = new_jobs(query, url, response)
+                if jobs is None:
+                    continue
+                if checkpoints is not None:
+                    checkpoints.complete(spec.source, query, jobs)
+            for job in jobs:
+                if full():
+                    break
+                count += 1
+                yield job
+            if jobs:
+                break
+    else:
+        for query in queries:
+            for job in unique(done.get(query, [])):
+                if full():
+                    break
+                count += 1
+                yield job
+
+        active = [query for query in queries if query not in done]
+        found = {query: [] for query in active}
+        for page in range(pages):
+            if not active or full():
+                break
+            urls = [spec.page_url(query, page) for query in active]
+            responses = fetch_many(urls)
+
+            still_active = []
+            for query, url, response in zip(active, urls, responses):
+                jobs = new_jobs(query, url, response)
+                if jobs:
+                    # Copies: the pipeline may change yielded jobs before the query is done
+                    found[query].extend(dict(job) for job in jobs)
+                    if all_known(jobs):
+                        logger.info(f"{spec.source} '{query}': page {page + 1} holds only known "
+                                    f"postings, not paging further")
+                    else:
+                        still_active.append(query)
+                if jobs is not None and query not in still_active and checkpoints is not None:
+                    checkpoints.complete(spec.source, query, found[query])
+                for job in jobs or []:
+                    if full():
+                        break
+                    count += 1
+                    yield job
+
+            active = still_active
+
+        # Out of pages, or enough jobs: the remaining queries are done too
+        if checkpoints is not None:
+            for query in active:
+                checkpoints.complete(spec.source, query, found[query])
+
+    logger.info(f"Found {count} jobs from {spec.source}")
+
+
+def scrape(spec: SourceSpec, queries: Iterable[str] = ('',),
+           max_results: Optional[int] = None, pages: Optional[int] = None) -> List[Dict]:
+    """List form of iter_scrape()"""
+    return list(iter_scrape(spec, queries, max_results, pages))
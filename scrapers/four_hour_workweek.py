@@ -3,82 +3,50 @@
 Scrapes remote jobs from Tim Ferriss's job board
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
-import logging
+from bs4 import SoupStrainer
+from typing import Dict, Iterator
 
+from scrapers.engine import Field, SourceSpec, iter_scrape
 
-logger = logging.getLogger(__name__)
 
+# The 4HWW job board is typically hosted on external platforms
+# Common URLs include job boards they partner with
+URLS = [
+    "https://www.fourhourworkweek.com/blog/jobs/",
+    "https://jobs.workable.com/fourhourworkweek"
+]
 
-def scrape_4hw_jobs(max_results: int = 30) -> List[Dict]:
+JOB_KEYWORDS = ['manager', 'operations', 'customer', 'product', 'remote', 'internal tools', 'cannabis']
+
+
+def _looks_like_job_link(link) -> bool:
+    return bool(link.string) and any(keyword in link.string.lower() for keyword in JOB_KEYWORDS)
+
+
+# Generic job listing parsing: look for links named like jobs
+SPEC = SourceSpec(
+    source='4-Hour Workweek',
+    url='{query}',
+    cards=['a[href]'],
+    strainer=SoupStrainer('a', href=True),
+    fields={
+        'title': Field('a'),
+        'url': Field('a[href]', attr='href'),
+    },
+    defaults={'company': '4HWW Partner'},
+    card_filter=_looks_like_job_link,
+    first_match_only=True,  # If we found jobs on one URL, no need to check others
+)
+
+
+def scrape_4hw_jobs(max_results: int = 30) -> Iterator[Dict]:
     """
     Scrape remote jobs from 4-Hour Workweek job board
     
     Args:
         max_results: Maximum number of jobs to return
     
-    Returns:
-        List of job dictionaries
+    Yields:
+        Job dictionaries, as each results page is parsed
     """
-    jobs = []
-    # The 4HWW job board is typically hosted on external platforms
-    # Common URLs include job boards they partner with
-    urls = [
-        "https://www.fourhourworkweek.com/blog/jobs/",
-        "https://jobs.workable.com/fourhourworkweek"
-    ]
-    
-    logger.info("Scraping 4-Hour Workweek job board")
-    
-    for url in urls:
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Generic job listing parsing
-            # Look for common job board patterns
-            job_links = soup.find_all('a', href=True, string=lambda x: x and any(
-                keyword in x.lower() for keyword in 
-                ['manager', 'operations', 'customer', 'product', 'remote', 'internal tools', 'cannabis']
-            ))
-            
-            for link in job_links[:max_results]:
-                try:
-                    job_url = link['href']
-                    if not job_url.startswith('http'):
-                        job_url = f"{url.rstrip('/')}/{job_url.lstrip('/')}"
-                    
-                    job = {
-                        'title': link.get_text(strip=True),
-                        'company': '4HWW Partner',
-                        'location': 'Remote',
-                        'description': '',
-                        'url': job_url,
-                        'source': '4-Hour Workweek'
-                    }
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing 4HWW job link: {e}")
-                    continue
-            
-            if jobs:  # If we found jobs on this URL, no need to check others
-                break
-            
-            time.sleep(2)
-            
-        except Exception as e:
-            logger.error(f"Error scraping 4HWW job board at {url}: {e}")
-            continue
-    
-    logger.info(f"Found {len(jobs)} jobs from 4-Hour Workweek")
-    return jobs
+    return iter_scrape(SPEC, URLS, max_results)
@@ -0,0 +1,189 @@
+"""
+HTTP Response Cache
+On-disk cache of scraped pages with conditional-GET revalidation
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+    Stores page bodies next to their ETag/Last-Modified validators
+
+    Entries younger than `ttl` are served without touching the network. Older
+    entries are revalidated with If-None-Match/If-Modified-Since, so a page
+    that hasn't changed comes back as a bodiless 304. The jobs parsed from a
+    body can be kept with it, so an unchanged page isn't parsed again either.
+    """
+
+    def __init__(self, directory: str = 'data/http_cache', ttl: float = 6 * 3600,
+                 max_age: float = 30 * 86400, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Args:
+            directory: Where bodies and metadata are written
+            ttl: Seconds an entry is served without revalidation
+            max_age: Seconds after which an unused entry is evicted
+            max_bytes: Total body size kept on disk before evicting oldest entries
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.json', self.directory / f'{key}.body'
+
+    def _parsed_path(self, url: str) -> Path:
+        return self._paths(url)[0].with_suffix('.parsed')
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the metadata stored for a URL, or None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not body_path.exists():
+            return None
+        return meta
+
+    def is_fresh(self, meta: Dict) -> bool:
+        """Whether an entry may be used without revalidating it"""
+        return time.time() - meta['validated_at'] < self.ttl
+
+    @staticmethod
+    def conditional_headers(meta: Dict) -> Dict:
+        """Build the revalidation headers for a cached entry"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, response: requests.Response):
+        """Save a 200 response body and its validators"""
+        meta_path, body_path = self._paths(url)
+        now = time.time()
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'stored_at': now,
+            'validated_at': now,
+            'size': len(response.content),
+        }
+        with self._lock:
+            _atomic_write(body_path, response.content)
+            _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def revalidated(self, meta: Dict):
+        """Record that the origin confirmed an entry is still current"""
+        meta_path, _ = self._paths(meta['url'])
+        meta = dict(meta, validated_at=time.time())
+        with self._lock:
+            _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def load(self, meta: Dict, not_modified: bool = False) -> requests.Response:
+        """
+        Rebuild a response object from a cached entry
+
+        The response carries `from_cache = True`, and `not_modified = True`
+        when it stands in for a 304 from the origin.
+        """
+        _, body_path = self._paths(meta['url'])
+
+        response = requests.Response()
+        response._content = body_path.read_bytes()
+        response.status_code = 200
+        response.url = meta['url']
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict({
+            k: v for k, v in (
+                ('Content-Type', meta.get('content_type')),
+                ('ETag', meta.get('etag')),
+                ('Last-Modified', meta.get('last_modified')),
+            ) if v
+        })
+        response.from_cache = True
+        response.not_modified = not_modified
+        return response
+
+    def load_parsed(self, url: str, parser: str, content: bytes) -> Optional[List[Dict]]:
+        """
+        Jobs parsed earlier from this exact page body
+
+        Args:
+            url: Page URL the jobs were stored under
+            parser: Version of the parsing code that must have produced them
+            content: The page body they must have been parsed from
+
+        Returns:
+            The jobs, or None if none were stored for this parser and body
+        """
+        try:
+            entry = json.loads(self._parsed_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+        if entry.get('parser') != parser or entry.get('body') != hashlib.sha256(content).hexdigest():
+            return None
+        return entry['jobs']
+
+    def store_parsed(self, url: str, parser: str, content: bytes, jobs: List[Dict]):
+        """Keep the jobs parsed from a page body; see load_parsed()"""
+        entry = {'parser': parser, 'body': hashlib.sha256(content).hexdigest(), 'jobs': jobs}
+        with self._lock:
+            _atomic_write(self._parsed_path(url), json.dumps(entry).encode('utf-8'))
+
+    def evict(self):
+        """Drop entries unused for `max_age`, then the oldest until under `max_bytes`"""
+        entries = []
+        for meta_path in self.directory.glob('*.json'):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta_path.unlink(missing_ok=True)
+                continue
+            entries.append((meta['validated_at'], meta.get('size', 0), meta_path))
+
+        entries.sort()
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for validated_at, size, meta_path in entries:
+            if now - validated_at < self.max_age and total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix('.body').unlink(missing_ok=True)
+            meta_path.with_suffix('.parsed').unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} cached pages from {self.directory}")
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write via a temp file so concurrent readers never see half a file"""
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
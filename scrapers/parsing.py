@@ -0,0 +1,45 @@
+"""
+HTML Parsing
+Shared BeautifulSoup entry point for every scraper
+"""
+
+from typing import Callable, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+
+def has_class(css_class: str) -> Callable[[Optional[str]], bool]:
+    """
+    Strainer attribute matcher for one CSS class
+
+    Strainers see the raw class attribute ("base-card job-search-card"),
+    not the split list find_all matches against, so `class_='base-card'`
+    alone would miss cards carrying several classes.
+    """
+    return lambda value: value is not None and css_class in value.split()
+
+
+def parse_html(content: Union[bytes, str], parse_only: Optional[SoupStrainer] = None,
+               parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse a page, optionally keeping only the elements a scraper reads
+
+    Uses lxml when it is installed and falls back to Python's html.parser.
+    With a strainer, only matching elements and their descendants are built
+    into the tree, which skips most of a large search page.
+
+    Args:
+        content: Raw page content
+        parse_only: Strainer selecting the job card elements
+        parser: Override the parser backend
+
+    Returns:
+        Parsed document
+    """
+    return BeautifulSoup(content, parser or PARSER, parse_only=parse_only)
@@ -0,0 +1,138 @@
+"""
+Per-Host Rate Limiting
+Token buckets that space out requests to each job board
+"""
+
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import threading
+import time
+
+
+# Minimum seconds between requests to a host, matching the delays the
+# scrapers used to sleep after every keyword
+DEFAULT_INTERVAL = 2.0
+HOST_INTERVALS = {
+    'www.linkedin.com': 3.0,
+    'www.indeed.com': 3.0,
+    'wellfound.com': 3.0,
+    'remoteok.com': 3.0,
+    'www.workatastartup.com': 2.0,
+    'www.fourhourworkweek.com': 2.0,
+    'jobs.workable.com': 2.0,
+    '80000hours.org': 2.0,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from both threads and coroutines"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, going into debt if none are left
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def cancel(self):
+        """Give back a token reserved but never used"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Block the calling thread until a token is available
+
+        Args:
+            timeout: Longest wait worth making; past it the token is given back
+
+        Returns:
+            Seconds waited, or None if the wait would have exceeded `timeout`
+        """
+        wait = self.reserve()
+        if timeout is not None and wait > timeout:
+            self.cancel()
+            return None
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> Optional[float]:
+        """Suspend the calling coroutine until a token is available; see acquire()"""
+        wait = self.reserve()
+        if timeout is not None and wait > timeout:
+            self.cancel()
+            return None
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class _Unlimited(TokenBucket):
+    """Bucket that never makes anyone wait"""
+
+    def __init__(self):
+        super().__init__(rate=1.0)
+
+    def reserve(self) -> float:
+        return 0.0
+
+    def cancel(self):
+        pass
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_lock = threading.Lock()
+_UNLIMITED = _Unlimited()
+_enabled = True
+
+
+def configure_rate_limits(enabled: bool = True):
+    """
+    Turn politeness delays on or off
+
+    Only switch them off when no request reaches a real job board, e.g.
+    when pages are served from fixtures.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def set_host_interval(host: str, seconds: float):
+    """Override the politeness delay for a host"""
+    with _lock:
+        HOST_INTERVALS[host] = seconds
+        _buckets.pop(host, None)
+
+
+def get_limiter(url: str) -> TokenBucket:
+    """Return the token bucket shared by every request to the URL's host"""
+    if not _enabled:
+        return _UNLIMITED
+    host = urlparse(url).netloc.lower()
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            interval = HOST_INTERVALS.get(host, DEFAULT_INTERVAL)
+            bucket = _buckets[host] = TokenBucket(rate=1.0 / interval)
+        return bucket
@@ -0,0 +1,53 @@
+"""
+Source Registry
+Job boards the daily run can scrape, imported only when a run needs them
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Name, module and scrape function of every source, in the order their
+# results are merged. Each module pulls in requests, bs4 and lxml, so they
+# are only imported by load_sources().
+SOURCES = [
+    ('LinkedIn', 'scrapers.linkedin', 'scrape_linkedin_jobs'),
+    ('Indeed', 'scrapers.indeed', 'scrape_indeed_jobs'),
+    ('Wellfound', 'scrapers.wellfound', 'scrape_wellfound_jobs'),
+    ('YC', 'scrapers.yc_jobs', 'scrape_yc_jobs'),
+    ('4-Hour Workweek', 'scrapers.four_hour_workweek', 'scrape_4hw_jobs'),
+    ('80,000 Hours', 'scrapers.eighty_thousand_hours', 'scrape_80k_hours_jobs'),
+    ('Remote OK', 'scrapers.remote_ok', 'scrape_remote_ok_jobs'),
+]
+
+
+def source_names() -> List[str]:
+    return [name for name, _, _ in SOURCES]
+
+
+def load_sources(names: Optional[Iterable[str]] = None) -> List[Tuple[str, Callable[[], Iterable[Dict]]]]:
+    """
+    Import the scrapers for some or all sources
+
+    Args:
+        names: Sources to load (case-insensitive); all of them by default
+
+    Returns:
+        (name, scrape function) pairs for iter_scrapers(), in SOURCES order
+
+    Raises:
+        ValueError: If a name isn't a registered source
+    """
+    wanted = None
+    if names is not None:
+        wanted = {name.lower() for name in names}
+        unknown = wanted - {name.lower() for name in source_names()}
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(sorted(unknown))}; "
+                             f"choose from {', '.join(source_names())}")
+
+    return [
+        (name, getattr(import_module(module), function))
+        for name, module, function in SOURCES
+        if wanted is None or name.lower() in wanted
+    ]
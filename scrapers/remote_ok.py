@@ -3,17 +3,31 @@ Remote OK Job Board Scraper
 Scrapes remote jobs from RemoteOK
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
-import logging
+from bs4 import SoupStrainer
+from typing import Dict, Iterator, List
 
+from scrapers.engine import Field, SourceSpec, iter_scrape
+from scrapers.parsing import has_class
 
-logger = logging.getLogger(__name__)
 
+# Remote OK uses table rows for jobs
+SPEC = SourceSpec(
+    source='Remote OK',
+    url='https://remoteok.com/remote-jobs/{query}',
+    cards=['tr.job'],
+    strainer=SoupStrainer('tr', class_=has_class('job')),
+    fields={
+        'title': Field('h2[itemprop="title"]'),
+        'company': Field('h3[itemprop="name"]'),
+        'location': Field('div.location'),
+        'url': Field('a[itemprop="url"][href]', attr='href'),
+    },
+    required=('title', 'company'),
+    per_page=15,  # Limit per keyword
+)
 
-def scrape_remote_ok_jobs(keywords: List[str] = None, max_results: int = 40) -> List[Dict]:
+
+def scrape_remote_ok_jobs(keywords: List[str] = None, max_results: int = 40) -> Iterator[Dict]:
     """
     Scrape remote jobs from Remote OK
     
@@ -21,72 +35,10 @@ def scrape_remote_ok_jobs(keywords: List[str] = None, max_results: int = 40) ->
         keywords: List of keywords to search for
         max_results: Maximum number of jobs to return
     
-    Returns:
-        List of job dictionaries
+    Yields:
+        Job dictionaries, as each results page is parsed
     """
     if keywords is None:
         keywords = ['operations', 'customer', 'product']
     
-    jobs = []
-    base_url = "https://remoteok.com/remote-jobs"
-    
-    logger.info(f"Scraping Remote OK for keywords: {keywords}")
-    
-    for keyword in keywords:
-        try:
-            url = f"{base_url}/{keyword}"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remote OK uses table rows for jobs
-            job_rows = soup.find_all('tr', class_='job')
-            
-            for row in job_rows[:15]:  # Limit per keyword
-                try:
-                    # Remote OK has specific structure
-                    title_elem = row.find('h2', itemprop='title')
-                    company_elem = row.find('h3', itemprop='name')
-                    link_elem = row.find('a', itemprop='url')
-                    location_elem = row.find('div', class_='location')
-                    
-                    if title_elem and company_elem:
-                        job_url = link_elem['href'] if link_elem else url
-                        if not job_url.startswith('http'):
-                            job_url = f"https://remoteok.com{job_url}"
-                        
-                        job = {
-                            'title': title_elem.get_text(strip=True),
-                            'company': company_elem.get_text(strip=True),
-                            'location': location_elem.get_text(strip=True) if location_elem else 'Remote',
-                            'description': '',
-                            'url': job_url,
-                            'source': 'Remote OK'
-                        }
-                        jobs.append(job)
-                        
-                        if len(jobs) >= max_results:
-                            break
-                            
-                except Exception as e:
-                    logger.warning(f"Error parsing Remote OK job row: {e}")
-                    continue
-            
-            # Rate limiting
-            time.sleep(3)
-            
-            if len(jobs) >= max_results:
-                break
-                
-        except Exception as e:
-            logger.error(f"Error scraping Remote OK for keyword '{keyword}': {e}")
-            continue
-    
-    logger.info(f"Found {len(jobs)} jobs from Remote OK")
-    return jobs
+    return iter_scrape(SPEC, keywords, max_results)
@@ -0,0 +1,148 @@
+"""
+Scraper Scheduler
+Runs job board scrapers concurrently with per-source timeouts
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+import queue
+import threading
+import time
+import logging
+
+from pipeline import metrics
+from scrapers.session import request_deadline
+
+
+logger = logging.getLogger(__name__)
+
+# How often the scheduler wakes up to check for timed-out sources
+POLL_INTERVAL = 1.0
+
+# Jobs buffered between the scrapers and the pipeline; a full buffer pauses
+# the scrapers until the pipeline catches up
+QUEUE_SIZE = 1000
+
+_DONE = object()
+
+
+def iter_scrapers(sources: List[Tuple[str, Callable[[], Iterable[Dict]]]],
+                  max_workers: int = 4,
+                  timeout: float = 300.0) -> Iterator[Dict]:
+    """
+    Run scrapers in parallel and yield their jobs as they arrive
+
+    Politeness delays are enforced per host by scrapers.ratelimit, so running
+    sources side by side only overlaps requests to different job boards. A source that
+    raises or exceeds its timeout is logged and stops contributing, so one
+    broken board never takes the others down with it; jobs it produced
+    before that point are kept. A timed-out source's requests are cut off at
+    the deadline, so its worker frees its slot for the queued sources
+    instead of holding it until a hung request returns.
+
+    Arrival order depends on thread timing, so each job is tagged with
+    `order`: (index of its source in `sources`, position within that
+    source). Dedup and TopN break ties on it, which keeps the summary the
+    same from one run to the next.
+
+    Args:
+        sources: (name, scrape function) pairs; each function returns an
+            iterable of jobs, ideally a lazy one
+        max_workers: Maximum number of scrapers running at once
+        timeout: Seconds a single source may run before it is abandoned
+
+    Yields:
+        Job dictionaries with `order` set, in arrival order
+    """
+    jobs = queue.Queue(maxsize=QUEUE_SIZE)
+    started = {}
+    counts = {name: 0 for name, _ in sources}
+    abandoned = set()
+    closed = threading.Event()
+
+    def put(item) -> bool:
+        while not closed.is_set():
+            try:
+                jobs.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(index: int, name: str, scrape: Callable[[], Iterable[Dict]]):
+        # The clock starts when a worker picks the source up, not when it is
+        # queued behind the concurrency cap
+        started[name] = time.monotonic()
+        metrics.current_source.set(name)
+        # Requests stop at the timeout too, so an abandoned source's worker
+        # gives its slot back to the queued sources instead of hanging on
+        request_deadline.set(started[name] + timeout)
+        logger.info(f"Scraping {name} jobs...")
+        error = None
+        try:
+            for position, job in enumerate(scrape()):
+                job['order'] = (index, position)
+                if name in abandoned or not put((name, job)):
+                    return
+        except Exception as e:
+            error = e
+        put((name, error if error is not None else _DONE))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+    for index, (name, scrape) in enumerate(sources):
+        executor.submit(run, index, name, scrape)
+    pending = set(counts)
+
+    try:
+        while pending:
+            try:
+                name, item = jobs.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                name, item = None, None
+
+            if name in pending:
+                elapsed = time.monotonic() - started.get(name, time.monotonic())
+                if item is _DONE:
+                    logger.info(f"{name} finished with {counts[name]} jobs in {elapsed:.1f}s")
+                    metrics.observe('source_seconds', elapsed, source=name, status='ok')
+                    pending.discard(name)
+                elif isinstance(item, Exception):
+                    logger.error(f"{name} scraper failed: {item}")
+                    metrics.observe('source_seconds', elapsed, source=name, status='failed')
+                    pending.discard(name)
+                else:
+                    counts[name] += 1
+                    metrics.count('source_jobs', source=name)
+                    yield item
+
+            now = time.monotonic()
+            for name in list(pending):
+                if name in started and now - started[name] >= timeout:
+                    # Threads can't be killed; the worker's requests fail from
+                    # now on, it stops at its next job and anything it still
+                    # sends is discarded
+                    logger.error(f"{name} scraper timed out after {timeout:.0f}s "
+                                 f"({counts[name]} jobs kept)")
+                    metrics.observe('source_seconds', now - started[name], source=name, status='timeout')
+                    abandoned.add(name)
+                    pending.discard(name)
+    finally:
+        closed.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_scrapers(sources: List[Tuple[str, Callable[[], Iterable[Dict]]]],
+                 max_workers: int = 4,
+                 timeout: float = 300.0) -> List[Dict]:
+    """
+    Run scrapers in parallel and collect their results
+
+    Args:
+        sources: (name, scrape function) pairs
+        max_workers: Maximum number of scrapers running at once
+        timeout: Seconds a single source may run before it is abandoned
+
+    Returns:
+        List of job dictionaries, merged in source order
+    """
+    return sorted(iter_scrapers(sources, max_workers, timeout), key=lambda job: job['order'])
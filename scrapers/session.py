@@ -0,0 +1,329 @@
+"""
+Shared HTTP Session
+Pooled, retrying HTTP client used by every scraper
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import threading
+import time
+import logging
+
+from pipeline import metrics
+from scrapers.http_cache import HttpCache
+from scrapers.ratelimit import get_limiter
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Retry policy for transient failures; see configure_session()
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_MAX = 120
+_settings = {
+    'retries': 3,
+    'backoff_factor': 1.0,
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+}
+
+_session = None
+_lock = threading.Lock()
+
+# Optional on-disk page cache; see configure_cache()
+_cache = None
+_offline = False
+
+# time.monotonic() after which fetch() refuses to make requests, set by the
+# scheduler for each source; copied into asyncio tasks and to_thread calls
+request_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+def configure_session(retries: int = None, backoff_factor: float = None,
+                      pool_connections: int = None, pool_maxsize: int = None):
+    """
+    Change the retry and pooling policy of the shared session
+
+    Args:
+        retries: Attempts after the first for 429/5xx and connection errors
+        backoff_factor: Exponential backoff base in seconds between retries
+        pool_connections: Number of hosts to keep connection pools for
+        pool_maxsize: Keep-alive connections kept open per host
+    """
+    global _session
+
+    overrides = {
+        'retries': retries,
+        'backoff_factor': backoff_factor,
+        'pool_connections': pool_connections,
+        'pool_maxsize': pool_maxsize,
+    }
+    with _lock:
+        _settings.update({k: v for k, v in overrides.items() if v is not None})
+        # Rebuilt lazily with the new settings on the next request
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _build_session() -> requests.Session:
+    """Create a session with keep-alive pools mounted"""
+    # No retries in the adapter: _send() retries, so it can stop at a deadline
+    adapter = HTTPAdapter(
+        max_retries=0,
+        pool_connections=_settings['pool_connections'],
+        pool_maxsize=_settings['pool_maxsize']
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # Advertises br (and zstd) only when urllib3 can actually decode them
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+    })
+    return session
+
+
+def configure_cache(directory: Optional[str] = 'data/http_cache', ttl: float = 6 * 3600,
+                    max_bytes: int = 50 * 1024 * 1024, offline: bool = False) -> Optional[HttpCache]:
+    """
+    Turn the conditional-GET page cache on or off
+
+    Args:
+        directory: Cache directory, or None to disable caching
+        ttl: Seconds a page is reused before it is revalidated
+        max_bytes: Disk budget for cached bodies
+        offline: Serve only from the cache and never touch the network
+
+    Returns:
+        The active cache, if any
+    """
+    global _cache, _offline
+
+    _cache = HttpCache(directory, ttl=ttl, max_bytes=max_bytes) if directory else None
+    _offline = offline
+    if _cache is not None:
+        _cache.evict()
+    return _cache
+
+
+def get_cache() -> Optional[HttpCache]:
+    """Return the page cache set up by configure_cache(), if any"""
+    return _cache
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use"""
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def _labels(url: str) -> Dict:
+    return {'source': metrics.current_source.get(), 'host': urlparse(url).netloc.lower()}
+
+
+def time_left(url: str) -> Optional[float]:
+    """
+    Seconds left before the current request_deadline, if one is set
+
+    Args:
+        url: URL about to be fetched, for the error message
+
+    Raises:
+        requests.Timeout: If the deadline has passed
+    """
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.Timeout(f"Source deadline passed before fetching {url}")
+    return remaining
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response]) -> float:
+    """Seconds to wait before retry number `attempt`, the way urllib3's Retry would"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    if attempt <= 1:
+        return 0.0
+    return min(BACKOFF_MAX, _settings['backoff_factor'] * 2 ** (attempt - 1))
+
+
+def _send(url: str, params: Optional[Dict], headers: Optional[Dict],
+          timeout: float) -> requests.Response:
+    """
+    GET with retries for 429/5xx and connection errors
+
+    Each attempt's timeout is cut to the time left before the
+    request_deadline, and no retry is started that its backoff would push
+    past it.
+
+    Returns:
+        The last response, which may still be an error status
+
+    Raises:
+        requests.RequestException: If the last attempt failed to connect or
+            timed out, or the deadline passed
+    """
+    session = get_session()
+    deadline = request_deadline.get()
+    attempt = 0
+    while True:
+        remaining = time_left(url)
+        error = response = None
+        try:
+            response = session.get(url, params=params, headers=headers,
+                                   timeout=timeout if remaining is None else min(timeout, remaining))
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                return response
+
+        attempt += 1
+        delay = _retry_delay(attempt, response)
+        if attempt > _settings['retries'] or \
+                (deadline is not None and time.monotonic() + delay >= deadline):
+            if error is not None:
+                raise error
+            return response
+        if response is not None:
+            response.close()
+        time.sleep(delay)
+
+
+def _from_cache(url: str, params: Optional[Dict], labels: Dict):
+    """
+    Look a page up in the cache
+
+    Returns:
+        (cache URL, cached metadata or None, the cached response if it can be
+        used without a request, else None)
+
+    Raises:
+        requests.ConnectionError: If the page isn't cached in offline mode
+    """
+    cache_url = requests.Request('GET', url, params=params).prepare().url
+    meta = _cache.lookup(cache_url) if _cache is not None else None
+
+    if meta and (_offline or _cache.is_fresh(meta)):
+        metrics.count('http_requests', result='cache', **labels)
+        return cache_url, meta, _cache.load(meta)
+    if _offline:
+        metrics.count('http_requests', result='offline_miss', **labels)
+        raise requests.ConnectionError(f"Offline mode: {cache_url} is not cached")
+    return cache_url, meta, None
+
+
+def fetch_cached(url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+    """
+    The page as fetch() would serve it from the cache, without a request
+
+    Lets a caller that takes rate limit tokens itself skip the wait for
+    pages that never reach the network.
+
+    Args:
+        url: URL to fetch
+        params: Optional query string parameters
+
+    Returns:
+        The cached response, or None if fetching it needs a request
+
+    Raises:
+        requests.ConnectionError: If the page isn't cached in offline mode
+    """
+    if _cache is None and not _offline:
+        return None
+    return _from_cache(url, params, _labels(url))[2]
+
+
+def fetch(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+          timeout: float = 10, throttle: bool = True) -> requests.Response:
+    """
+    GET a page through the shared session
+
+    Waits on the host's token bucket first, so politeness is enforced per
+    domain rather than by sleeping the whole scraper. Under a
+    request_deadline, neither the token wait nor the retries run past it:
+    each attempt's timeout is cut to the time left, and no request is made
+    once it has passed. With the page cache
+    enabled, fresh pages are served from disk and stale ones are revalidated;
+    the returned response then has `from_cache` and `not_modified` set.
+
+    Args:
+        url: URL to fetch
+        params: Optional query string parameters
+        headers: Optional headers added to the session defaults
+        timeout: Seconds to wait for the server on each attempt
+        throttle: Set False when the caller already holds a rate limit token
+
+    Returns:
+        The response, after retries
+
+    Raises:
+        requests.RequestException: If the request still fails after retries,
+            the page isn't cached in offline mode, or the deadline has passed
+    """
+    labels = _labels(url)
+
+    meta = None
+    if _cache is not None or _offline:
+        cache_url, meta, response = _from_cache(url, params, labels)
+        if response is not None:
+            return response
+        if meta:
+            headers = {**_cache.conditional_headers(meta), **(headers or {})}
+
+    start = None
+    try:
+        if throttle:
+            waited = get_limiter(url).acquire(timeout=time_left(url))
+            if waited is None:
+                raise requests.Timeout(f"Source deadline would pass waiting to fetch {url}")
+            metrics.observe('ratelimit_wait_seconds', waited, **labels)
+        start = time.perf_counter()
+        response = _send(url, params, headers, timeout)
+    except requests.RequestException:
+        metrics.count('http_requests', result='error', **labels)
+        raise
+    finally:
+        if start is not None:
+            metrics.observe('http_request_seconds', time.perf_counter() - start, **labels)
+
+    if response.status_code == 304 and meta:
+        metrics.count('http_requests', result='not_modified', **labels)
+        _cache.revalidated(meta)
+        return _cache.load(meta, not_modified=True)
+
+    if not response.ok:
+        metrics.count('http_requests', result='error', **labels)
+    response.raise_for_status()
+    response.from_cache = False
+    response.not_modified = False
+    metrics.count('http_requests', result='network', **labels)
+    metrics.count('http_bytes', len(response.content), **labels)
+
+    if _cache is not None:
+        _cache.store(cache_url, response)
+    return response
@@ -3,17 +3,28 @@ Wellfound (formerly AngelList Talent) Jobs Scraper
 Scrapes startup jobs from Wellfound
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
-import logging
+from bs4 import SoupStrainer
+from typing import Dict, Iterator, List
 
+from scrapers.engine import Field, SourceSpec, iter_scrape
 
-logger = logging.getLogger(__name__)
 
+# Wellfound has role-specific pages and uses data attributes for its cards
+SPEC = SourceSpec(
+    source='Wellfound',
+    url='https://wellfound.com/role/{query}/remote',
+    cards=['div[data-test="JobSearchResult"]'],
+    strainer=SoupStrainer('div', attrs={'data-test': 'JobSearchResult'}),
+    fields={
+        'title': Field('h2', 'a[data-test="job-title"]'),
+        'company': Field('div[data-test="company-name"]'),
+        'url': Field('a[href]', attr='href'),
+    },
+    per_page=15,  # Limit per role
+)
 
-def scrape_wellfound_jobs(roles: List[str] = None, max_results: int = 50) -> List[Dict]:
+
+def scrape_wellfound_jobs(roles: List[str] = None, max_results: int = 50) -> Iterator[Dict]:
     """
     Scrape remote startup jobs from Wellfound
     
@@ -21,73 +32,10 @@ def scrape_wellfound_jobs(roles: List[str] = None, max_results: int = 50) -> Lis
         roles: List of role types to search for
         max_results: Maximum number of jobs to return
     
-    Returns:
-        List of job dictionaries
+    Yields:
+        Job dictionaries, as each results page is parsed
     """
     if roles is None:
         roles = ['operations', 'customer-success', 'product-manager']
     
-    jobs = []
-    base_url = "https://wellfound.com/role"
-    
-    logger.info(f"Scraping Wellfound jobs for roles: {roles}")
-    
-    for role in roles:
-        try:
-            # Wellfound has role-specific pages
-            url = f"{base_url}/{role}/remote"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Parse job listings
-            job_cards = soup.find_all('div', {'data-test': 'JobSearchResult'})
-            
-            for card in job_cards[:15]:  # Limit per role
-                try:
-                    # Wellfound uses specific data attributes
-                    title_elem = card.find('h2') or card.find('a', {'data-test': 'job-title'})
-                    company_elem = card.find('div', {'data-test': 'company-name'})
-                    location_elem = card.find('span', string=lambda x: x and 'Remote' in x)
-                    link_elem = card.find('a', href=True)
-                    
-                    if title_elem:
-                        job_url = link_elem['href'] if link_elem else url
-                        if not job_url.startswith('http'):
-                            job_url = f"https://wellfound.com{job_url}"
-                        
-                        job = {
-                            'title': title_elem.get_text(strip=True),
-                            'company': company_elem.get_text(strip=True) if company_elem else 'Unknown',
-                            'location': 'Remote',
-                            'description': '',
-                            'url': job_url,
-                            'source': 'Wellfound'
-                        }
-                        jobs.append(job)
-                        
-                        if len(jobs) >= max_results:
-                            break
-                            
-                except Exception as e:
-                    logger.warning(f"Error parsing Wellfound job card: {e}")
-                    continue
-            
-            # Rate limiting
-            time.sleep(3)
-            
-            if len(jobs) >= max_results:
-                break
-                
-        except Exception as e:
-            logger.error(f"Error scraping Wellfound for role '{role}': {e}")
-            continue
-    
-    logger.info(f"Found {len(jobs)} jobs from Wellfound")
-    return jobs
+    return iter_scrape(SPEC, roles, max_results)
@@ -0,0 +1,269 @@
+"""
+Job Archive
+Append-only, gzip-compressed JSON Lines history of every scraped job
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+
+
+logger = logging.getLogger(__name__)
+
+# Columns kept in the columnar export, in order; every job has these
+ARCHIVE_FIELDS = ('title', 'company', 'location', 'description', 'url', 'source')
+
+_DAY_FILE = re.compile(r'^jobs-(\d{4}-\d{2}-\d{2})\.jsonl\.gz$')
+_LEGACY_FILE = re.compile(r'^jobs_(\d{4}-\d{2}-\d{2})\.jsonl?$')
+
+
+def _posting_key(job: Dict) -> Tuple:
+    """What makes two archived lines the same posting"""
+    return tuple(job.get(field) for field in ARCHIVE_FIELDS)
+
+
+def _pyarrow():
+    """Import pyarrow, which only the Arrow export needs"""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("The Arrow export needs pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+class JobArchive:
+    """
+    One compressed JSON Lines file per day, only ever appended to
+
+    Each run appends its jobs to the day's file as a new gzip member, so a
+    second run on the same day adds to that day's history instead of
+    replacing it. Postings an earlier run already archived that day are not
+    written again, so a resumed run replaying its checkpoint doesn't double
+    the day. Days can be streamed back one job at a time, or exported to
+    Arrow files that are memory-mapped for column-wise analysis.
+    """
+
+    def __init__(self, directory: str = 'data/archive'):
+        """
+        Args:
+            directory: Folder holding the day files
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, date: str) -> Path:
+        return self.directory / f'jobs-{date}.jsonl.gz'
+
+    def columnar_path_for(self, date: str) -> Path:
+        return self.directory / f'jobs-{date}.arrow'
+
+    def dates(self, start: Optional[str] = None, end: Optional[str] = None) -> List[str]:
+        """
+        Days with archived jobs, oldest first
+
+        Args:
+            start: First date to include (YYYY-MM-DD), inclusive
+            end: Last date to include (YYYY-MM-DD), inclusive
+        """
+        found = []
+        for path in self.directory.iterdir():
+            match = _DAY_FILE.match(path.name)
+            if match and (start is None or match.group(1) >= start) and (end is None or match.group(1) <= end):
+                found.append(match.group(1))
+        return sorted(found)
+
+    def record(self, jobs: Iterable[Dict], date: str) -> Iterator[Dict]:
+        """
+        Append each job to the day's file as it passes through
+
+        Jobs an earlier run archived the same day are passed through without
+        being written again.
+
+        Args:
+            jobs: Job dictionaries
+            date: Date string (YYYY-MM-DD)
+
+        Yields:
+            The same jobs, unchanged
+        """
+        path = self.path_for(date)
+        # The run's gzip member is built in a side file and appended whole:
+        # a member cut short by a crash would make the rest of the day's
+        # file unreadable. Side files left behind by a killed run are dropped.
+        for stale in self.directory.glob(f'{path.name}.*.part'):
+            stale.unlink()
+        part = path.with_name(f'{path.name}.{os.getpid()}.part')
+        recorded = {_posting_key(job) for job in self.iter_jobs(date, date)} if path.exists() else set()
+
+        written = skipped = 0
+        try:
+            with gzip.open(part, 'wt', encoding='utf-8') as f:
+                for job in jobs:
+                    if recorded and _posting_key(job) in recorded:
+                        skipped += 1
+                    else:
+                        f.write(json.dumps(job, separators=(',', ':')) + '\n')
+                        written += 1
+                    yield job
+        finally:
+            if part.exists():
+                with open(part, 'rb') as src, open(path, 'ab') as dst:
+                    shutil.copyfileobj(src, dst)
+                part.unlink()
+        logger.info(f"Archived {written} raw jobs to {path}"
+                    + (f" ({skipped} already archived today)" if skipped else ''))
+
+    def append(self, jobs: Iterable[Dict], date: str) -> int:
+        """Append jobs to the day's file, returning how many were written"""
+        return sum(1 for _ in self.record(jobs, date))
+
+    def iter_jobs(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Stream archived jobs for a date range without loading whole days
+
+        Args:
+            start: First date (YYYY-MM-DD), inclusive
+            end: Last date (YYYY-MM-DD), inclusive
+
+        Yields:
+            Job dictionaries, oldest day first and in archive order within a day
+        """
+        for _, job in self.iter_dated(start, end):
+            yield job
+
+    def iter_dated(self, start: Optional[str] = None,
+                   end: Optional[str] = None) -> Iterator[Tuple[str, Dict]]:
+        """Like iter_jobs(), but yields (date, job) pairs"""
+        for date in self.dates(start, end):
+            with gzip.open(self.path_for(date), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield date, json.loads(line)
+
+    def export_columnar(self, date: str) -> Path:
+        """
+        Write one day as an Arrow IPC file next to its JSON Lines file
+
+        Requires pyarrow. The export is rebuilt from the day's archive, so it
+        can be regenerated at any time.
+
+        Returns:
+            Path of the Arrow file
+        """
+        pa = _pyarrow()
+
+        columns = {name: [] for name in ARCHIVE_FIELDS}
+        for _, job in self.iter_dated(date, date):
+            for name in ARCHIVE_FIELDS:
+                value = job.get(name)
+                columns[name].append(None if value is None else str(value))
+
+        table = pa.table({name: pa.array(values, type=pa.string()) for name, values in columns.items()})
+        # The archive only grows, so its size tells whether an export is current
+        source_size = self.path_for(date).stat().st_size
+        table = table.replace_schema_metadata({'source_size': str(source_size)})
+        path = self.columnar_path_for(date)
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        logger.info(f"Exported {table.num_rows} jobs to {path}")
+        return path
+
+    def read_columns(self, start: Optional[str] = None, end: Optional[str] = None,
+                     columns: Optional[List[str]] = None, export_missing: bool = True):
+        """
+        Memory-map the Arrow exports for a date range as one table
+
+        Requires pyarrow. Columns are read straight from the mapped files, so
+        only the pages actually touched are loaded.
+
+        Args:
+            start: First date (YYYY-MM-DD), inclusive
+            end: Last date (YYYY-MM-DD), inclusive
+            columns: Subset of ARCHIVE_FIELDS to read; all by default
+            export_missing: Export days whose Arrow file is missing or out of date
+
+        Returns:
+            pyarrow.Table with a `date` column added
+        """
+        pa = _pyarrow()
+
+        columns = list(columns or ARCHIVE_FIELDS)
+        tables = []
+        for date in self.dates(start, end):
+            path = self.columnar_path_for(date)
+            table = self._open_columnar(path) if path.exists() else None
+            # A day appended to after its export is exported again
+            if table is None or table.schema.metadata.get(b'source_size') != str(
+                    self.path_for(date).stat().st_size).encode():
+                if not export_missing:
+                    continue
+                table = self._open_columnar(self.export_columnar(date))
+            table = table.select(columns)
+            tables.append(table.append_column('date', pa.array([date] * table.num_rows, type=pa.string())))
+
+        if not tables:
+            schema = pa.schema([(name, pa.string()) for name in columns + ['date']])
+            return schema.empty_table()
+        return pa.concat_tables(tables)
+
+    @staticmethod
+    def _open_columnar(path: Path):
+        pa = _pyarrow()
+
+        with pa.memory_map(str(path), 'r') as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def import_legacy(self, directory: str = 'data') -> int:
+        """
+        Move old data/jobs_<date>.json(l) dumps into the archive
+
+        The old files are left in place for the caller to delete.
+
+        Returns:
+            Number of days imported
+        """
+        imported = 0
+        for path in sorted(Path(directory).iterdir()):
+            match = _LEGACY_FILE.match(path.name)
+            if not match:
+                continue
+            if path.suffix == '.json':
+                with open(path) as f:
+                    jobs = json.load(f)
+            else:
+                with open(path) as f:
+                    jobs = [json.loads(line) for line in f if line.strip()]
+            self.append(jobs, match.group(1))
+            imported += 1
+        return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the job archive')
+    parser.add_argument('--directory', default='data/archive', help='Archive folder')
+    parser.add_argument('--import-legacy', metavar='DIR',
+                        help='Import old jobs_<date>.json(l) files from DIR')
+    parser.add_argument('--export-columnar', nargs=2, metavar=('START', 'END'),
+                        help='Write Arrow files for every archived day in the range')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    archive = JobArchive(args.directory)
+
+    if args.import_legacy:
+        print(f"Imported {archive.import_legacy(args.import_legacy)} days")
+    if args.export_columnar:
+        for date in archive.dates(*args.export_columnar):
+            archive.export_columnar(date)
+
+
+if __name__ == '__main__':
+    main()
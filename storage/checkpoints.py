@@ -0,0 +1,84 @@
+"""
+Run Checkpoints
+Per-day record of finished scrape units, so an interrupted run can resume
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import re
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+_DAY_FILE = re.compile(r'^(\d{4}-\d{2}-\d{2})\.jsonl$')
+
+
+class CheckpointStore:
+    """
+    Jobs found by every finished (source, query) unit of one day's run
+
+    Each unit is appended to `<directory>/<date>.jsonl` as one JSON line the
+    moment it finishes, and flushed to disk, so a run that dies halfway
+    keeps everything completed before the crash. A line cut short by the
+    crash is ignored. Checkpoints of earlier days are deleted on open.
+    """
+
+    def __init__(self, date: str, directory: str = 'data/checkpoints'):
+        """
+        Args:
+            date: Day of the run (YYYY-MM-DD)
+            directory: Folder holding one checkpoint file per day
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f'{date}.jsonl'
+        self.units: Dict[Tuple[str, str], List[Dict]] = {}
+        self._lock = threading.Lock()
+
+        for path in self.directory.iterdir():
+            match = _DAY_FILE.match(path.name)
+            if match and match.group(1) < date:
+                path.unlink()
+
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        unit = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.units[(unit['source'], unit['query'])] = unit['jobs']
+            logger.info(f"Loaded {len(self.units)} finished scrape units from {self.path}")
+
+    def completed(self, source: str, query: str) -> Optional[List[Dict]]:
+        """Jobs of a unit finished earlier today, or None if it still has to run"""
+        with self._lock:
+            jobs = self.units.get((source, query))
+        return None if jobs is None else [dict(job) for job in jobs]
+
+    def complete(self, source: str, query: str, jobs: List[Dict]):
+        """
+        Record a finished unit
+
+        Args:
+            source: Source name
+            query: Search query (or URL) of the unit
+            jobs: Every job the unit found
+        """
+        line = json.dumps({'source': source, 'query': query, 'jobs': jobs}, separators=(',', ':'))
+        with self._lock:
+            self.units[(source, query)] = [dict(job) for job in jobs]
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self):
+        """Forget today's units, so the next run starts from scratch"""
+        with self._lock:
+            self.units = {}
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,60 @@
+"""
+Description Store
+SQLite cache of job descriptions fetched from posting pages
+"""
+
+from typing import Dict, Iterable
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_descriptions (
+    url TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class DescriptionStore:
+    """
+    Descriptions keyed by canonical posting URL
+
+    A posting's page is fetched at most once in its lifetime; pages that
+    yielded no description are remembered too, so they aren't retried.
+    """
+
+    def __init__(self, path: str = 'data/jobs.db'):
+        """
+        Args:
+            path: SQLite database file, shared with the seen-jobs store
+        """
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Return the stored description for each URL that has one"""
+        found = {}
+        with self._lock:
+            for url in urls:
+                row = self.conn.execute(
+                    'SELECT description FROM job_descriptions WHERE url = ?', (url,)
+                ).fetchone()
+                if row is not None:
+                    found[url] = row[0]
+        return found
+
+    def put_many(self, descriptions: Dict[str, str]):
+        """Store fetched descriptions (empty strings mark pages with none)"""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO job_descriptions VALUES (?, ?, ?)',
+                [(url, text, now) for url, text in descriptions.items()]
+            )
+
+    def close(self):
+        self.conn.close()
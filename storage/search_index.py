@@ -0,0 +1,264 @@
+"""
+Job Search Index
+SQLite FTS5 full-text index over every job the agent has scraped
+
+Usage:
+    python -m storage.search_index --backfill
+    python -m storage.search_index "remote fintech operations" --days 90
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import argparse
+import logging
+import re
+import sqlite3
+import threading
+
+from storage.archive import JobArchive
+from storage.seen_jobs import posting_id
+
+
+logger = logging.getLogger(__name__)
+
+# The FTS table reads its text from indexed_jobs (external content), kept
+# in sync by the triggers; a posting seen again unchanged isn't re-indexed
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT UNIQUE NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    description TEXT,
+    source TEXT,
+    url TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_indexed_jobs_last_seen ON indexed_jobs (last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS job_search USING fts5(
+    title, company, location, description, source,
+    content='indexed_jobs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS indexed_jobs_ai AFTER INSERT ON indexed_jobs BEGIN
+    INSERT INTO job_search (rowid, title, company, location, description, source)
+    VALUES (new.id, new.title, new.company, new.location, new.description, new.source);
+END;
+CREATE TRIGGER IF NOT EXISTS indexed_jobs_ad AFTER DELETE ON indexed_jobs BEGIN
+    INSERT INTO job_search (job_search, rowid, title, company, location, description, source)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description, old.source);
+END;
+CREATE TRIGGER IF NOT EXISTS indexed_jobs_au AFTER UPDATE OF title, company, location, description, source
+ON indexed_jobs WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+    OR old.location IS NOT new.location OR old.description IS NOT new.description
+    OR old.source IS NOT new.source
+BEGIN
+    INSERT INTO job_search (job_search, rowid, title, company, location, description, source)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description, old.source);
+    INSERT INTO job_search (rowid, title, company, location, description, source)
+    VALUES (new.id, new.title, new.company, new.location, new.description, new.source);
+END;
+CREATE TABLE IF NOT EXISTS indexed_days (
+    date TEXT PRIMARY KEY,
+    archive_size INTEGER NOT NULL
+);
+"""
+
+# A posting seen again keeps its first sighting date, and keeps its
+# description if the new sighting has none
+UPSERT = """
+INSERT INTO indexed_jobs (job_id, title, company, location, description, source, url, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    description = CASE WHEN excluded.description != '' THEN excluded.description ELSE description END,
+    source = excluded.source,
+    url = excluded.url,
+    first_seen = MIN(first_seen, excluded.first_seen),
+    last_seen = MAX(last_seen, excluded.last_seen)
+"""
+
+# bm25() column weights: title, company, location, description, source
+COLUMN_WEIGHTS = (10.0, 3.0, 2.0, 1.0, 1.0)
+
+
+def to_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query that matches every word
+
+    Words are quoted, so punctuation in the query can't be read as FTS
+    syntax; a trailing * keeps prefix matching (e.g. `fin*`).
+    """
+    terms = re.findall(r'\w+\*?', query.lower())
+    return ' '.join(f'"{term.rstrip("*")}"' + ('*' if term.endswith('*') else '') for term in terms)
+
+
+class SearchIndex:
+    """
+    Full-text index of postings, one row per posting across all days
+
+    Postings are keyed like the seen-jobs store, so a job scraped on many
+    days is one hit with its first and last sighting dates.
+    """
+
+    def __init__(self, path: str = 'data/jobs.db'):
+        """
+        Args:
+            path: SQLite database file, shared with the seen-jobs store
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def add(self, jobs: Iterable[Dict], date: str) -> int:
+        """
+        Index jobs seen on a day, updating postings already indexed
+
+        Args:
+            jobs: Job dictionaries
+            date: Date they were seen (YYYY-MM-DD)
+
+        Returns:
+            Number of jobs written
+        """
+        rows = [
+            (posting_id(job), job.get('title'), job.get('company'), job.get('location'),
+             job.get('description') or '', job.get('source'), job.get('url'), date, date)
+            for job in jobs
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def mark_indexed(self, archive: JobArchive, date: str):
+        """
+        Record a day as fully indexed, so backfill() skips it until it grows
+
+        Args:
+            archive: Job archive holding the day
+            date: Day whose jobs were all passed to add() (YYYY-MM-DD)
+        """
+        path = archive.path_for(date)
+        if path.exists():
+            with self._lock, self.conn:
+                self.conn.execute('INSERT OR REPLACE INTO indexed_days VALUES (?, ?)',
+                                  (date, path.stat().st_size))
+
+    def backfill(self, archive: JobArchive, start: Optional[str] = None,
+                 end: Optional[str] = None) -> int:
+        """
+        Index archived days that are new or have grown since they were indexed
+
+        Args:
+            archive: Job archive to read
+            start: First date (YYYY-MM-DD), inclusive
+            end: Last date (YYYY-MM-DD), inclusive
+
+        Returns:
+            Number of days indexed
+        """
+        with self._lock:
+            indexed = dict(self.conn.execute('SELECT date, archive_size FROM indexed_days'))
+
+        days = 0
+        for date in archive.dates(start, end):
+            size = archive.path_for(date).stat().st_size
+            if indexed.get(date) == size:
+                continue
+            count = self.add(archive.iter_jobs(date, date), date)
+            self.mark_indexed(archive, date)
+            logger.info(f"Indexed {count} jobs from {date}")
+            days += 1
+        return days
+
+    def search(self, query: str, since: Optional[str] = None, until: Optional[str] = None,
+               source: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Find postings matching every word of a query, best match first
+
+        Args:
+            query: Free text, e.g. "remote fintech operations"
+            since: Only postings last seen on or after this date (YYYY-MM-DD)
+            until: Only postings first seen on or before this date (YYYY-MM-DD)
+            source: Only postings from this source
+            limit: Maximum number of hits
+
+        Returns:
+            Hits with the posting's fields, first/last sighting dates, a
+            description snippet and its bm25 `rank` (lower is better)
+        """
+        match = to_match_query(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT j.title, j.company, j.location, j.source, j.url, j.first_seen, j.last_seen, "
+            "snippet(job_search, 3, '[', ']', '…', 12), bm25(job_search, ?, ?, ?, ?, ?) AS rank "
+            "FROM job_search JOIN indexed_jobs j ON j.id = job_search.rowid "
+            "WHERE job_search MATCH ?"
+        )
+        params = [*COLUMN_WEIGHTS, match]
+        if since:
+            sql += " AND j.last_seen >= ?"
+            params.append(since)
+        if until:
+            sql += " AND j.first_seen <= ?"
+            params.append(until)
+        if source:
+            sql += " AND j.source = ?"
+            params.append(source)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        fields = ('title', 'company', 'location', 'source', 'url', 'first_seen', 'last_seen',
+                  'snippet', 'rank')
+        return [dict(zip(fields, row)) for row in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def print_hits(hits: List[Dict]):
+    """Print search hits, one block per posting"""
+    if not hits:
+        print("No matching jobs")
+        return
+    for i, hit in enumerate(hits, 1):
+        print(f"{i}. {hit['title']} at {hit['company']} ({hit['location']}, {hit['source']})")
+        print(f"   seen {hit['first_seen']} to {hit['last_seen']}  {hit['url']}")
+        if hit['snippet']:
+            print(f"   {hit['snippet']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search every job the agent has scraped')
+    parser.add_argument('query', nargs='?', help='Words every hit must contain')
+    parser.add_argument('--db', default='data/jobs.db', help='SQLite database')
+    parser.add_argument('--archive', default='data/archive', help='Archive folder for --backfill')
+    parser.add_argument('--backfill', action='store_true', help='Index archived days first')
+    parser.add_argument('--days', type=int, help='Only jobs seen in the last N days')
+    parser.add_argument('--source', help='Only jobs from this source')
+    parser.add_argument('--limit', type=int, default=20, help='Maximum number of hits')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    index = SearchIndex(args.db)
+
+    if args.backfill:
+        print(f"Indexed {index.backfill(JobArchive(args.archive))} archived days")
+    if args.query:
+        since = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d') if args.days else None
+        print_hits(index.search(args.query, since=since, source=args.source, limit=args.limit))
+    index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Seen Jobs Store
+SQLite record of every posting the agent has scraped, across runs
+"""
+
+from typing import Dict, List, Optional, Tuple
+import logging
+import sqlite3
+import threading
+
+from analyzers.dedup import canonicalize_url
+from analyzers.score_cache import job_key
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    job_id TEXT PRIMARY KEY,
+    canonical_url TEXT,
+    content_hash TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    source TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_changed TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_jobs_url ON seen_jobs (canonical_url);
+CREATE INDEX IF NOT EXISTS idx_seen_jobs_hash ON seen_jobs (content_hash);
+"""
+
+
+def posting_id(job: Dict, canonical: Optional[str] = None, content_hash: Optional[str] = None) -> str:
+    """
+    Stable identity of a posting across runs
+
+    Its canonical URL plus normalized title, or its content hash when it has
+    no URL. Cards without a link share the search page URL, so the title is
+    part of the identity.
+
+    Args:
+        job: Job dictionary
+        canonical: The job's canonical URL, if already computed
+        content_hash: The job's job_key(), if already computed
+    """
+    if canonical is None:
+        canonical = job.get('canonical_url') or canonicalize_url(job.get('url', ''))
+    if not canonical:
+        return f'hash:{content_hash or job_key(job)}'
+    title = ' '.join((job.get('title') or '').lower().split())
+    return f'{canonical}|{title}'
+
+
+class SeenJobsStore:
+    """
+    Remembers postings between daily runs
+
+    A posting is identified by its canonical URL and title, or by its content
+    hash when it has no URL. Its content hash is kept alongside, so a posting
+    whose company, location or description changed counts as new again.
+    """
+
+    def __init__(self, path: str = 'data/jobs.db'):
+        """
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        # Scraper threads may ask is_known() while the main thread writes
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def is_known(self, url: str, before: Optional[str] = None) -> bool:
+        """
+        Whether a posting URL was seen on an earlier run
+
+        Args:
+            url: Posting URL
+            before: Only count postings first seen before this date
+                (YYYY-MM-DD), so today's own sightings don't count
+        """
+        canonical = canonicalize_url(url)
+        if not canonical:
+            return False
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT 1 FROM seen_jobs WHERE canonical_url = ? AND first_seen < ? LIMIT 1',
+                (canonical, before or '9999-12-31')
+            ).fetchone()
+        return row is not None
+
+    def classify(self, jobs: List[Dict], today: str) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split jobs into new-or-changed and unchanged, and record the sighting
+
+        Each job gets `first_seen` set. Every job's last-seen date moves to
+        `today`; new jobs are inserted and changed jobs take their new hash.
+        Jobs that were new or changed earlier the same day still count as new.
+
+        Args:
+            jobs: Deduplicated job dictionaries
+            today: Date string (YYYY-MM-DD)
+
+        Returns:
+            (new or changed jobs, unchanged jobs), each in input order
+        """
+        fresh, unchanged = [], []
+
+        with self._lock, self.conn:
+            for job in jobs:
+                canonical = job.get('canonical_url') or canonicalize_url(job.get('url', ''))
+                content_hash = job_key(job)
+                job_id = posting_id(job, canonical, content_hash)
+
+                row = self.conn.execute(
+                    'SELECT content_hash, first_seen, last_changed FROM seen_jobs WHERE job_id = ?',
+                    (job_id,)
+                ).fetchone()
+
+                if row is None:
+                    self.conn.execute(
+                        'INSERT INTO seen_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (job_id, canonical, content_hash, job.get('title'), job.get('company'),
+                         job.get('source'), today, today, today)
+                    )
+                    job['first_seen'] = today
+                    fresh.append(job)
+                    continue
+
+                job['first_seen'] = row[1]
+                if row[0] != content_hash:
+                    self.conn.execute(
+                        'UPDATE seen_jobs SET content_hash = ?, title = ?, company = ?, '
+                        'last_seen = ?, last_changed = ? WHERE job_id = ?',
+                        (content_hash, job.get('title'), job.get('company'), today, today, job_id)
+                    )
+                    fresh.append(job)
+                else:
+                    self.conn.execute(
+                        'UPDATE seen_jobs SET last_seen = ? WHERE job_id = ?', (today, job_id)
+                    )
+                    # A second run on the same day reports the same jobs
+                    (fresh if row[2] == today else unchanged).append(job)
+
+        logger.info(f"{len(fresh)} new or changed jobs, {len(unchanged)} already seen")
+        return fresh, unchanged
+
+    def close(self):
+        self.conn.close()